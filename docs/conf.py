@@ -39,7 +39,7 @@ author = "The napari team"
 extensions = [
     "sphinx.ext.intersphinx",
     "sphinx_external_toc",
-    "myst_nb",
+    "myst_parser",
     "sphinx.ext.viewcode",
     "sphinx_favicon",
     "sphinx_copybutton",
@@ -113,17 +113,26 @@ html_css_files = [
 ]
 
 intersphinx_mapping = {
-    "python": ["https://docs.python.org/3", None],
-    "numpy": ["https://numpy.org/doc/stable/", None],
-    "napari_plugin_engine": [
+    "python": (
+        "https://docs.python.org/3/",
+        "https://docs.python.org/3/objects.inv",
+    ),
+    "numpy": (
+        "https://numpy.org/doc/stable/",
+        "https://numpy.org/doc/stable/objects.inv",
+    ),
+    "napari_plugin_engine": (
         "https://napari-plugin-engine.readthedocs.io/en/latest/",
         "https://napari-plugin-engine.readthedocs.io/en/latest/objects.inv",
-    ],
-    "napari": [
-        "https://napari.org/dev",
+    ),
+    "napari": (
+        "https://napari.org/dev/",
         "https://napari.org/dev/objects.inv",
-    ],
+    ),
 }
+# Inventories are fetched concurrently by Sphinx; cap slow servers so a
+# single straggler does not hold up the whole build.
+intersphinx_timeout = 10
 
 myst_enable_extensions = [
     "colon_fence",
@@ -143,8 +152,7 @@ templates_path = ["_templates"]
 # This pattern also affects html_static_path and html_extra_path.
 exclude_patterns = [
     "_build",
+    "_doctrees",
     "Thumbs.db",
     ".DS_Store",
-    ".jupyter_cache",
-    "jupyter_execute",
 ]
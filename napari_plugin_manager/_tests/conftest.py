@@ -6,21 +6,38 @@ from qtpy.QtWidgets import QDialog, QInputDialog, QMessageBox
 
 from napari_plugin_manager.qt_package_installer import CondaInstallerTool
 
+_qdialog_exec = QDialog.exec_
+
+
+def _raise_on_call(*_, **__):
+    raise RuntimeError("exec_ call")  # pragma: no cover
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _block_message_box():
+    # The replacements never change, so patch these only once per session
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(QMessageBox, "exec_", _raise_on_call)
+        monkeypatch.setattr(QMessageBox, "critical", _raise_on_call)
+        monkeypatch.setattr(QMessageBox, "information", _raise_on_call)
+        monkeypatch.setattr(QMessageBox, "question", _raise_on_call)
+        monkeypatch.setattr(QMessageBox, "warning", _raise_on_call)
+        monkeypatch.setattr(QInputDialog, "getText", _raise_on_call)
+        monkeypatch.setattr(QDialog, "exec_", _raise_on_call)
+        yield
+
 
 @pytest.fixture(autouse=True)
-def _block_message_box(monkeypatch, request):
-    def raise_on_call(*_, **__):
-        raise RuntimeError("exec_ call")  # pragma: no cover
-
-    monkeypatch.setattr(QMessageBox, "exec_", raise_on_call)
-    monkeypatch.setattr(QMessageBox, "critical", raise_on_call)
-    monkeypatch.setattr(QMessageBox, "information", raise_on_call)
-    monkeypatch.setattr(QMessageBox, "question", raise_on_call)
-    monkeypatch.setattr(QMessageBox, "warning", raise_on_call)
-    monkeypatch.setattr(QInputDialog, "getText", raise_on_call)
-    # QDialogs can be allowed via a marker; only raise if not decorated
+def _block_dialog(request):
+    # QDialogs can be allowed via a marker; only those tests need to touch
+    # the session-wide patch, by putting back the real `exec_`
     if "enabledialog" not in request.keywords:
-        monkeypatch.setattr(QDialog, "exec_", raise_on_call)
+        yield
+        return
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(QDialog, "exec_", _qdialog_exec)
+        yield
 
 
 if TYPE_CHECKING:
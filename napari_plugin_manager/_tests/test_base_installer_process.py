@@ -21,3 +21,10 @@ def test_not_implemented_methods():
 
     with pytest.raises(NotImplementedError):
         tool.available()
+
+
+def test_ident_is_unique():
+    tool = AbstractInstallerTool('install', ['requests'])
+    other = AbstractInstallerTool('install', ['requests'])
+    assert tool.ident == tool.ident
+    assert tool.ident != other.ident
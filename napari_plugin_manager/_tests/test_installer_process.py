@@ -8,12 +8,14 @@ from typing import TYPE_CHECKING
 
 import pytest
 from qtpy.QtCore import QProcessEnvironment
+from qtpy.QtWidgets import QTextEdit
 
 import napari_plugin_manager.base_qt_package_installer as bqpi
 from napari_plugin_manager.base_qt_package_installer import (
     AbstractInstallerTool,
     InstallerActions,
     InstallerTools,
+    clear_installer_tool_cache,
 )
 from napari_plugin_manager.qt_package_installer import (
     NapariCondaInstallerTool,
@@ -138,6 +140,150 @@ def test_pip_installer_tasks(
         )
 
 
+def test_pip_installer_batches_queued_jobs(
+    qtbot, tmp_virtualenv: 'Session', monkeypatch
+):
+    installer = NapariInstallerQueue()
+    monkeypatch.setattr(
+        NapariPipInstallerTool,
+        "executable",
+        lambda *a: tmp_virtualenv.creator.exe,
+    )
+    started = []
+    finished = []
+    installer.started.connect(lambda: started.append(True))
+    installer.processFinished.connect(finished.append)
+    with qtbot.waitSignal(installer.allFinished, timeout=20000):
+        # queued together, so all three run in a single pip process
+        installer.install(
+            tool=InstallerTools.PIP,
+            pkgs=['pip-install-test'],
+        )
+        installer.install(
+            tool=InstallerTools.PIP,
+            pkgs=['typing-extensions'],
+        )
+        installer.install(
+            tool=InstallerTools.PIP,
+            pkgs=['requests'],
+        )
+
+    assert len(started) == 1
+    assert [data['pkgs'] for data in finished] == [
+        ['pip-install-test'],
+        ['typing-extensions'],
+        ['requests'],
+    ]
+    assert all(data['exit_code'] == 0 for data in finished)
+    assert not installer.hasJobs()
+
+
+class _SleepingTool(AbstractInstallerTool):
+    @classmethod
+    def executable(cls):
+        return sys.executable
+
+    def arguments(self):
+        return ('-c', 'import time; time.sleep(60)')
+
+    def environment(self, env=None):
+        return QProcessEnvironment.systemEnvironment()
+
+
+def test_cancel_job_of_running_batch(qtbot, monkeypatch):
+    installer = NapariInstallerQueue()
+    monkeypatch.setattr(installer, "_get_tool", lambda *a: _SleepingTool)
+    finished = []
+    installer.processFinished.connect(finished.append)
+    with qtbot.waitSignal(installer.started, timeout=10000):
+        job_id_1 = installer.install(tool=_SleepingTool, pkgs=['a'])
+        job_id_2 = installer.install(tool=_SleepingTool, pkgs=['b'])
+        job_id_3 = installer.install(tool=_SleepingTool, pkgs=['c'])
+    assert installer._merged_ids == {
+        job_id_1: job_id_1,
+        job_id_2: job_id_1,
+        job_id_3: job_id_1,
+    }
+
+    # the rest of the batch starts again without the cancelled job
+    with qtbot.waitSignal(installer.started, timeout=10000):
+        installer.cancel(job_id_2)
+    assert finished == [
+        {
+            'exit_code': 1,
+            'exit_status': 0,
+            'action': InstallerActions.CANCEL,
+            'pkgs': ['b'],
+        }
+    ]
+    assert installer._merged_ids == {job_id_1: job_id_1, job_id_3: job_id_1}
+    with pytest.raises(bqpi.JobNotFoundError):
+        installer.cancel(job_id_2)
+
+    with qtbot.waitSignal(installer.allFinished, timeout=10000):
+        installer.cancel(job_id_3)
+        installer.cancel(job_id_1)
+    assert [data['pkgs'] for data in finished] == [['b'], ['c'], ['a']]
+    assert not installer.hasJobs()
+
+
+def test_jobs_queued_while_running_are_not_merged(qtbot, monkeypatch):
+    installer = NapariInstallerQueue()
+    monkeypatch.setattr(installer, "_get_tool", lambda *a: _SleepingTool)
+    with qtbot.waitSignal(installer.started, timeout=10000):
+        job_id_1 = installer.install(tool=_SleepingTool, pkgs=['a'])
+    job_id_2 = installer.install(tool=_SleepingTool, pkgs=['b'])
+    job_id_3 = installer.install(tool=_SleepingTool, pkgs=['c'])
+    assert installer._merged_ids == {job_id_1: job_id_1}
+
+    with qtbot.waitSignal(installer.started, timeout=10000):
+        installer.cancel(job_id_1)
+    assert installer._merged_ids == {job_id_2: job_id_2}
+
+    with qtbot.waitSignal(installer.allFinished, timeout=10000):
+        installer.cancel_all()
+    assert job_id_3 not in installer._merged_ids
+
+
+class _FailingTool(_SleepingTool):
+    def arguments(self):
+        return ('-c', 'raise SystemExit(1)')
+
+
+def test_failed_batch_reports_jobs(qtbot, monkeypatch):
+    installer = NapariInstallerQueue()
+    output_widget = QTextEdit()
+    qtbot.addWidget(output_widget)
+    installer.set_output_widget(output_widget)
+    monkeypatch.setattr(installer, "_get_tool", lambda *a: _FailingTool)
+    with qtbot.waitSignal(installer.allFinished, timeout=10000):
+        installer.install(tool=_FailingTool, pkgs=['a'])
+        installer.install(tool=_FailingTool, pkgs=['b'])
+    assert (
+        "The jobs for a, b ran in a single process and failed together."
+        in output_widget.toPlainText()
+    )
+
+
+def test_pip_installer_wait_for_finished(
+    qtbot, tmp_virtualenv: 'Session', monkeypatch
+):
+    installer = NapariInstallerQueue()
+    monkeypatch.setattr(
+        NapariPipInstallerTool,
+        "executable",
+        lambda *a: tmp_virtualenv.creator.exe,
+    )
+    assert installer.waitForFinished()
+
+    installer.install(
+        tool=InstallerTools.PIP,
+        pkgs=['pip-install-test'],
+    )
+    assert installer.waitForFinished(20000)
+    assert not installer.hasJobs()
+
+
 def test_pip_installer_invalid_action(tmp_virtualenv: 'Session', monkeypatch):
     installer = NapariInstallerQueue()
     monkeypatch.setattr(
@@ -155,7 +301,6 @@ def test_pip_installer_invalid_action(tmp_virtualenv: 'Session', monkeypatch):
             pkgs=['pip-install-test'],
             prefix=None,
             origins=(),
-            process=installer._create_process(),
         )
         installer._queue_item(item)
 
@@ -211,7 +356,7 @@ def test_cancel_incorrect_job_id(qtbot, tmp_virtualenv: 'Session'):
             tool=InstallerTools.PIP,
             pkgs=['requests'],
         )
-        with pytest.raises(ValueError):
+        with pytest.raises(bqpi.JobNotFoundError, match="No job with id"):
             installer.cancel(job_id + 1)
 
 
@@ -363,6 +508,108 @@ def test_available():
     assert NapariPipInstallerTool.available()
 
 
+@pytest.fixture
+def _tool_cache():
+    """Forget the tool lookups made with a patched environment."""
+    yield
+    clear_installer_tool_cache()
+
+
+@pytest.mark.usefixtures('_tool_cache')
+def test_clear_installer_tool_cache(monkeypatch, tmp_path):
+    conda_exe = tmp_path / 'conda'
+    conda_exe.touch()
+    NapariCondaInstallerTool.executable()
+    monkeypatch.setenv('MAMBA_EXE', str(conda_exe))
+    assert NapariCondaInstallerTool.executable() != str(conda_exe)
+
+    clear_installer_tool_cache()
+    assert NapariCondaInstallerTool.executable() == str(conda_exe)
+
+
+def test_pip_constraints(monkeypatch):
+    tool = NapariPipInstallerTool(InstallerActions.INSTALL, ('requests',))
+    constraints_file = '/tmp/constraints.txt'
+    monkeypatch.setattr(
+        NapariPipInstallerTool,
+        '_constraints_file',
+        classmethod(lambda cls: constraints_file),
+    )
+    assert '-c' not in tool.arguments()
+    env = tool.environment(QProcessEnvironment())
+    assert env.value('PIP_CONSTRAINT') == constraints_file
+    env = QProcessEnvironment()
+    env.insert('PIP_CONSTRAINT', 'other.txt')
+    env = tool.environment(env)
+    assert env.value('PIP_CONSTRAINT') == f'{constraints_file} other.txt'
+
+    # pip splits PIP_CONSTRAINT on whitespace, pass such paths as arguments
+    constraints_file = '/my tmp/constraints.txt'
+    monkeypatch.setattr(
+        NapariPipInstallerTool,
+        '_constraints_file',
+        classmethod(lambda cls: constraints_file),
+    )
+    args = tool.arguments()
+    assert args[args.index('-c') + 1] == constraints_file
+    env = QProcessEnvironment()
+    env.insert('PIP_CONSTRAINT', 'other.txt')
+    env = tool.environment(env)
+    assert env.value('PIP_CONSTRAINT') == 'other.txt'
+
+    tool = NapariPipInstallerTool(InstallerActions.UNINSTALL, ('requests',))
+    env = tool.environment(QProcessEnvironment())
+    assert not env.contains('PIP_CONSTRAINT')
+
+
+def test_pip_constraints_file_written_once():
+    first = NapariPipInstallerTool._constraints_file()
+    assert NapariPipInstallerTool._constraints_file() == first
+    assert Path(first).read_text() == "\n".join(
+        NapariPipInstallerTool.constraints()
+    )
+
+
+def test_output_widget_batches_appends(qtbot):
+    installer = NapariInstallerQueue()
+    output_widget = QTextEdit()
+    qtbot.addWidget(output_widget)
+    installer.set_output_widget(output_widget)
+
+    installer._log('one')
+    installer._log('two')
+    assert output_widget.toPlainText() == ''
+
+    qtbot.waitUntil(
+        lambda: output_widget.toPlainText() == 'one\ntwo', timeout=1000
+    )
+
+    # output is plain text, pending output is flushed to the previous widget
+    installer._log('<b>three</b>')
+    installer.set_output_widget(QTextEdit())
+    assert output_widget.toPlainText() == 'one\ntwo\n<b>three</b>'
+
+
+def test_process_output_split_character():
+    process = NapariInstallerQueue()._create_process()
+    encoded = 'é'.encode()
+    assert process._stdout_decoder.decode(encoded[:1]) == ''
+    assert process._stdout_decoder.decode(encoded[1:]) == 'é'
+
+
+def test_process_output_finished_on_split_character(qtbot):
+    installer = NapariInstallerQueue()
+    output_widget = QTextEdit()
+    qtbot.addWidget(output_widget)
+    installer.set_output_widget(output_widget)
+    process = installer._create_process()
+    assert process._stderr_decoder.decode('é'.encode()[:1]) == ''
+
+    installer._finish_output(process)
+    installer._flush_output()
+    assert output_widget.toPlainText() == '\ufffd'
+
+
 def test_unrecognized_tool():
     with pytest.raises(ValueError):
         NapariInstallerQueue().install(tool='shrug', pkgs=[])
@@ -1,16 +1,26 @@
+import io
 from urllib.error import HTTPError, URLError
 
+import pytest
 from flaky import flaky
 
+from napari_plugin_manager import npe2api
 from napari_plugin_manager.npe2api import (
     _user_agent,
     cache_clear,
+    clear_disk_cache,
     conda_map,
     iter_napari_plugin_info,
     plugin_summaries,
 )
 
 
+@pytest.fixture(autouse=True)
+def _disk_cache(monkeypatch, tmp_path):
+    """Keep the responses cached on disk out of the user cache directory."""
+    monkeypatch.setattr(npe2api, '_cache_path', lambda name: tmp_path / name)
+
+
 def test_user_agent():
     assert _user_agent()
 
@@ -60,3 +70,63 @@ def test_clear_cache():
     assert _user_agent.cache_info().hits >= 1
     cache_clear()
     assert _user_agent.cache_info().hits == 0
+
+
+def test_get_json_revalidates_disk_cache(monkeypatch):
+    requests = []
+
+    class _Response(io.BytesIO):
+        headers = {'ETag': '"1"'}
+
+    def _urlopen(request):
+        requests.append(request)
+        if request.get_header('If-none-match') == '"1"':
+            raise HTTPError(request.full_url, 304, 'Not Modified', {}, None)
+        return _Response(b'{"napari-svg": null}')
+
+    monkeypatch.setattr(npe2api, 'urlopen', _urlopen)
+    for _ in range(2):
+        data = npe2api._get_json('https://example.com', 'conda')
+        assert data == {'napari-svg': None}
+    assert len(requests) == 2
+
+
+def test_get_json_offline_uses_disk_cache(monkeypatch, tmp_path):
+    class _Response(io.BytesIO):
+        headers = {'ETag': '"1"'}
+
+    monkeypatch.setattr(
+        npe2api, 'urlopen', lambda request: _Response(b'{"napari-svg": null}')
+    )
+    npe2api._get_json('https://example.com', 'conda')
+
+    def _urlopen(request):
+        raise URLError('offline')
+
+    monkeypatch.setattr(npe2api, 'urlopen', _urlopen)
+    data = npe2api._get_json('https://example.com', 'conda')
+    assert data == {'napari-svg': None}
+
+    cache_clear()
+    assert (tmp_path / 'conda').exists()
+    clear_disk_cache()
+    assert not (tmp_path / 'conda').exists()
+    with pytest.raises(URLError):
+        npe2api._get_json('https://example.com', 'conda')
+
+
+def test_get_json_ignores_incomplete_disk_cache(monkeypatch, tmp_path):
+    (tmp_path / 'conda').write_text('{"etag": "\\"1\\""}', encoding='utf-8')
+    requests = []
+
+    class _Response(io.BytesIO):
+        headers = {'ETag': '"1"'}
+
+    def _urlopen(request):
+        requests.append(request)
+        return _Response(b'{"napari-svg": null}')
+
+    monkeypatch.setattr(npe2api, 'urlopen', _urlopen)
+    data = npe2api._get_json('https://example.com', 'conda')
+    assert data == {'napari-svg': None}
+    assert requests[0].get_header('If-none-match') is None
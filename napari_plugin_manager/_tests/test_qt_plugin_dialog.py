@@ -1,6 +1,8 @@
 import importlib.metadata
 import os
 import sys
+from collections import deque
+from types import MappingProxyType
 from typing import Generator, Optional, Tuple
 from unittest.mock import patch
 
@@ -8,7 +10,6 @@ import napari.plugins
 import npe2
 import pytest
 import qtpy
-from napari.plugins._tests.test_npe2 import mock_pm  # noqa
 from napari.utils.translations import trans
 from qtpy.QtCore import QMimeData, QPointF, Qt, QTimer, QUrl
 from qtpy.QtGui import QDropEvent
@@ -30,6 +31,31 @@ from napari_plugin_manager.base_qt_package_installer import InstallerActions
 N_MOCKED_PLUGINS = 2
 
 
+# This mock `base_data`` will be the same for all fake plugins.
+_MOCK_PACKAGES = ['pyzenhub', 'requests', 'my-plugin', 'my-test-old-plugin-1']
+_MOCK_BASE_DATA = {
+    "metadata_version": "1.0",
+    "version": "0.1.0",
+    "summary": "some test package",
+    "home_page": "http://napari.org",
+    "author": "test author",
+    "license": "UNKNOWN",
+}
+_MOCK_PLUGIN_INFO = tuple(
+    (
+        npe2.PackageMetadata(name=name, **_MOCK_BASE_DATA),
+        bool(i),
+        {
+            "home_page": 'www.mywebsite.com',
+            "pypi_versions": ['2.31.0'],
+            "conda_versions": ['2.32.1'],
+            'display_name': name.upper(),
+        },
+    )
+    for i, name in enumerate(_MOCK_PACKAGES)
+)
+
+
 def _iter_napari_pypi_plugin_info(
     conda_forge: bool = True,
 ) -> Generator[
@@ -39,31 +65,29 @@ def _iter_napari_pypi_plugin_info(
 
     This will mock napari.plugins.pypi.iter_napari_plugin_info` for pypi.
 
-    It will return two fake plugins that will populate the available plugins
-    list (the bottom one).
+    It will return fake plugins that will populate the available plugins
+    list (the bottom one). The plugin data is built once at import time.
     """
-    # This mock `base_data`` will be the same for both fake plugins.
-    packages = ['pyzenhub', 'requests', 'my-plugin', 'my-test-old-plugin-1']
-    base_data = {
-        "metadata_version": "1.0",
-        "version": "0.1.0",
-        "summary": "some test package",
-        "home_page": "http://napari.org",
-        "author": "test author",
-        "license": "UNKNOWN",
+    yield from _MOCK_PLUGIN_INFO
+
+
+_MOCK_METADATA = MappingProxyType(
+    {
+        'version': '0.1.0',
+        'summary': '',
+        'Home-page': '',
+        'author': '',
+        'license': '',
     }
-    for i in range(len(packages)):
-        yield npe2.PackageMetadata(name=f"{packages[i]}", **base_data), bool(
-            i
-        ), {
-            "home_page": 'www.mywebsite.com',
-            "pypi_versions": ['2.31.0'],
-            "conda_versions": ['2.32.1'],
-            'display_name': packages[i].upper(),
-        }
+)
+
+# The dialog only needs the name and npe1_shim flag of installed manifests
+_MOCK_MANIFEST = npe2.PluginManifest(name='my-plugin')
 
 
 class PluginsMock:
+    __slots__ = ('plugins',)
+
     def __init__(self):
         self.plugins = {
             'requests': True,
@@ -73,6 +97,8 @@ class PluginsMock:
 
 
 class OldPluginsMock:
+    __slots__ = ('plugins', 'enabled')
+
     def __init__(self):
         self.plugins = [
             ('my-test-old-plugin-1', False, 'my-test-old-plugin-1')
@@ -80,17 +106,19 @@ class OldPluginsMock:
         self.enabled = [True]
 
 
-@pytest.fixture
-def old_plugins(qtbot):
+@pytest.fixture(scope="module")
+def old_plugins():
     return OldPluginsMock()
 
 
-@pytest.fixture
-def plugins(qtbot):
+@pytest.fixture(scope="module")
+def plugins():
     return PluginsMock()
 
 
 class WarnPopupMock:
+    __slots__ = ('_is_visible',)
+
     def __init__(self, text):
         self._is_visible = False
 
@@ -113,22 +141,71 @@ class WarnPopupMock:
         return 100
 
 
-@pytest.fixture(params=[True, False], ids=["constructor", "no-constructor"])
-def plugin_dialog(
-    request,
-    qtbot,
-    monkeypatch,
-    mock_pm,  # noqa
-    plugins,
-    old_plugins,
-):
-    """Fixture that provides a plugin dialog for a normal napari install."""
+@pytest.fixture(scope="module")
+def tmp_virtualenv(tmp_path_factory):
+    """Virtualenv shared by the install tests of this module.
+
+    These tests only ever install `requests` into it, so they can reuse one
+    environment instead of each creating their own.
+    """
+    virtualenv = pytest.importorskip('virtualenv')
+
+    path = tmp_path_factory.mktemp('venv')
+    cmd = [str(path), '--no-setuptools', '--no-wheel', '--activators', '']
+    return virtualenv.cli_run(cmd)
+
+
+def _reset_dialog(widget, qtbot, plugins, old_plugins):
+    """Bring the shared dialog back to the state of a freshly opened one."""
+    if widget.worker is not None:
+        # Flush results still queued by the previous worker before clearing
+        qtbot.waitUntil(lambda: not widget.worker.is_running, timeout=3000)
+        QApplication.processEvents()
+    if widget.installer.hasJobs():
+        widget.installer.cancel_all()
+
+    plugins.plugins.update(PluginsMock().plugins)
+    old_plugins.enabled[:] = OldPluginsMock().enabled
+
+    widget.set_prefix(None)
+    widget.packages_search.clear()
+    # The mocked fetch is tiny, so let it deliver every result up front
+    with qtbot.waitSignal(widget.finished, timeout=3000):
+        widget.refresh()
+    if not widget.isVisible():
+        widget.show()
+
+
+def _add_queued_items(widget):
+    """Add the items queued by the last search without waiting on the timer."""
+    widget._add_items_timer.stop()
+    while (
+        widget._plugin_queue
+        and widget.available_list.count_visible()
+        < widget.MAX_PLUGIN_SEARCH_ITEMS
+    ):
+        widget._add_items()
+
+
+@pytest.fixture(
+    scope="module", params=[True, False], ids=["constructor", "no-constructor"]
+)
+def _plugin_dialog(request, qapp, plugins, old_plugins):
+    """Plugin dialog for a normal napari install, shared across the module."""
 
     class PluginManagerMock:
+        __slots__ = ('_instance',)
+
+        def __init__(self):
+            # The instance only wraps shared state, so hand out the same one
+            self._instance = PluginManagerInstanceMock(plugins)
+
         def instance(self):
-            return PluginManagerInstanceMock(plugins)
+            return self._instance
 
     class PluginManagerInstanceMock:
+        __slots__ = ('plugins',)
+
         def __init__(self, plugins):
             self.plugins = plugins.plugins
 
@@ -136,7 +213,7 @@ def plugin_dialog(
             yield from self.plugins
 
         def iter_manifests(self):
-            yield from [mock_pm.get_manifest('my-plugin')]
+            yield _MOCK_MANIFEST
 
         def is_disabled(self, name):
             return False
@@ -152,17 +229,9 @@ def plugin_dialog(
             self.plugins[plugin] = False
             return
 
-    def mock_metadata(name):
-        meta = {
-            'version': '0.1.0',
-            'summary': '',
-            'Home-page': '',
-            'author': '',
-            'license': '',
-        }
-        return meta
-
     class OldPluginManagerMock:
+        __slots__ = ('plugins', 'enabled')
+
         def __init__(self):
             self.plugins = old_plugins.plugins
             self.enabled = old_plugins.enabled
@@ -180,39 +249,59 @@ def plugin_dialog(
             self.enabled[0] = not blocked
             return
 
-    monkeypatch.setattr(
-        qt_plugin_dialog,
-        "iter_napari_plugin_info",
-        _iter_napari_pypi_plugin_info,
-    )
-    monkeypatch.setattr(qt_plugin_dialog, 'WarnPopup', WarnPopupMock)
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(
+            qt_plugin_dialog,
+            "iter_napari_plugin_info",
+            _iter_napari_pypi_plugin_info,
+        )
+        monkeypatch.setattr(qt_plugin_dialog, 'WarnPopup', WarnPopupMock)
+
+        # This is patching `napari.utils.misc.running_as_constructor_app` function
+        # to mock a normal napari install.
+        monkeypatch.setattr(
+            qt_plugin_dialog,
+            "running_as_constructor_app",
+            lambda: request.param,
+        )
+        monkeypatch.setattr(
+            napari.plugins, 'plugin_manager', OldPluginManagerMock()
+        )
 
-    # This is patching `napari.utils.misc.running_as_constructor_app` function
-    # to mock a normal napari install.
-    monkeypatch.setattr(
-        qt_plugin_dialog, "running_as_constructor_app", lambda: request.param
-    )
-    monkeypatch.setattr(
-        napari.plugins, 'plugin_manager', OldPluginManagerMock()
-    )
+        monkeypatch.setattr(
+            importlib.metadata, 'metadata', lambda name: _MOCK_METADATA
+        )
 
-    monkeypatch.setattr(importlib.metadata, 'metadata', mock_metadata)
+        monkeypatch.setattr(npe2, 'PluginManager', PluginManagerMock())
 
-    monkeypatch.setattr(npe2, 'PluginManager', PluginManagerMock())
+        widget = qt_plugin_dialog.QtPluginDialog()
+        monkeypatch.setattr(
+            widget, '_is_main_app_conda_package', lambda: request.param
+        )
+        # monkeypatch.setattr(widget, '_tag_outdated_plugins', lambda: None)
+        widget.show()
+        yield widget
+        widget.hide()
+        widget._add_items_timer.stop()
+        widget.close()
+        widget.deleteLater()
 
-    widget = qt_plugin_dialog.QtPluginDialog()
-    monkeypatch.setattr(
-        widget, '_is_main_app_conda_package', lambda: request.param
-    )
-    # monkeypatch.setattr(widget, '_tag_outdated_plugins', lambda: None)
-    widget.show()
-    qtbot.waitUntil(widget.isVisible, timeout=300)
+
+@pytest.fixture
+def plugin_dialog(_plugin_dialog, qtbot, plugins, old_plugins):
+    """Fixture that provides a plugin dialog for a normal napari install.
+
+    The dialog itself is built once per module; every test gets it back in
+    the state of a freshly opened dialog.
+    """
+    widget = _plugin_dialog
+    _reset_dialog(widget, qtbot, plugins, old_plugins)
+    # `show` marks the widget visible right away, no need to poll for it
+    assert widget.isVisible()
 
     assert widget.available_list.count_visible() == 0
     assert widget.available_list.count() == 0
-    qtbot.add_widget(widget)
     yield widget
-    widget.hide()
     widget._add_items_timer.stop()
     assert not widget._add_items_timer.isActive()
 
@@ -227,7 +316,7 @@ def test_filter_not_available_plugins(request, plugin_dialog, qtbot):
             reason="This test is only relevant for constructor-based installs"
         )
     plugin_dialog.search("e")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item = plugin_dialog.available_list.item(0)
     widget = plugin_dialog.available_list.itemWidget(item)
     if widget:
@@ -246,31 +335,40 @@ def test_filter_available_plugins(plugin_dialog, qtbot):
     list (the bottom one).
     """
     plugin_dialog.search("")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     assert plugin_dialog.available_list.count() == 0
     assert plugin_dialog.available_list.count_visible() == 0
 
     plugin_dialog.search("no-match@123")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     assert plugin_dialog.available_list.count_visible() == 0
 
     plugin_dialog.search("")
     plugin_dialog.search("requests")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     assert plugin_dialog.available_list.count_visible() == 1
 
 
+def test_items_populated(plugin_dialog, qtbot):
+    """Check that the timer driven search signals when all items are added."""
+    with qtbot.waitSignal(plugin_dialog.itemsPopulated, timeout=3000):
+        plugin_dialog.search("e")
+
+    assert not plugin_dialog._plugin_queue
+    assert plugin_dialog.available_list.count_visible() == 2
+
+
 def test_filter_installed_plugins(plugin_dialog, qtbot):
     """
     Test the dialog is correctly filtering plugins in the installed plugins
     list (the top one).
     """
     plugin_dialog.search("")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     assert plugin_dialog.installed_list.count_visible() == 2
 
     plugin_dialog.search("no-match@123")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     assert plugin_dialog.installed_list.count_visible() == 0
 
 
@@ -291,7 +389,7 @@ def test_version_dropdown(plugin_dialog, qtbot):
     Test that when the source drop down is changed, it displays the other versions properly.
     """
     plugin_dialog.search("requests")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     widget = plugin_dialog.available_list.item(0).widget
     count = widget.version_choice_dropdown.count()
     if count == 2:
@@ -305,6 +403,26 @@ def test_plugin_list_count_items(plugin_dialog):
     assert plugin_dialog.installed_list.count_visible() == 2
 
 
+def test_plugin_list_items_of_same_package(plugin_dialog):
+    plugin_list = plugin_dialog.installed_list
+    count = plugin_list.count()
+    project_info = qt_plugin_dialog.ProjectInfoVersions(
+        npe2.PackageMetadata(name="multi-plugin", version="0.1.0"),
+        "multi-plugin",
+        [],
+        [],
+    )
+    plugin_list.addItem(project_info, plugin_name="multi-plugin-a")
+    plugin_list.addItem(project_info, plugin_name="multi-plugin-b")
+    assert plugin_list.packages().count("multi-plugin") == 2
+
+    plugin_list.removeItem("multi-plugin")
+    assert plugin_list.packages().count("multi-plugin") == 1
+    plugin_list.removeItem("multi-plugin")
+    assert "multi-plugin" not in plugin_list.packages()
+    assert plugin_list.count() == count
+
+
 def test_plugin_list_handle_action(plugin_dialog, qtbot):
     item = plugin_dialog.installed_list.item(0)
     with patch.object(qt_plugin_dialog.PluginListItem, "set_busy") as mock:
@@ -326,7 +444,7 @@ def test_plugin_list_handle_action(plugin_dialog, qtbot):
         assert mock.called
 
     plugin_dialog.search("requests")
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item = plugin_dialog.available_list.item(0)
     if item is not None:
         with patch.object(qt_plugin_dialog.PluginListItem, "set_busy") as mock:
@@ -372,6 +490,30 @@ def test_on_enabled_checkbox(plugin_dialog, qtbot, plugins, old_plugins):
     assert old_plugins.enabled[0] is False
 
 
+def test_add_items_waits_for_free_slots(plugin_dialog, monkeypatch):
+    monkeypatch.setattr(plugin_dialog, 'MAX_PLUGIN_SEARCH_ITEMS', 1)
+    plugin_dialog._plugin_queue = deque(
+        (
+            npe2.PackageMetadata(name=name, version="0.1.0"),
+            True,
+            {"pypi_versions": ["0.1.0"], "conda_versions": ["0.1.0"]},
+        )
+        for name in ("queued-plugin-a", "queued-plugin-b")
+    )
+    plugin_dialog._add_items_timer.start()
+    plugin_dialog._add_items()
+    plugin_dialog._add_items()
+    assert plugin_dialog.available_list.count() == 1
+    assert plugin_dialog._add_items_timer.isActive()
+
+    # a hidden row frees its slot for the next queued plugin
+    plugin_dialog.available_list.hideAll()
+    plugin_dialog._add_items()
+    assert plugin_dialog.available_list.count() == 2
+    plugin_dialog._add_items()
+    assert not plugin_dialog._add_items_timer.isActive()
+
+
 def test_add_items_outdated_and_update(plugin_dialog, qtbot):
     """
     Test that a plugin is tagged as outdated (a newer version is available), the update button becomes visible.
@@ -394,13 +536,16 @@ def test_add_items_outdated_and_update(plugin_dialog, qtbot):
         },
     )
     plugin_dialog._plugin_data_map["my-plugin"] = new_plugin
-    plugin_dialog._plugin_queue = [new_plugin]
+    plugin_dialog._plugin_queue = deque([new_plugin])
     plugin_dialog._add_items()
     item = plugin_dialog.installed_list.item(0)
     widget = plugin_dialog.installed_list.itemWidget(item)
     initial_version = "0.1.0"
     mod_initial_version = initial_version.replace('.', '․')  # noqa: RUF001
     assert widget.update_btn.isVisible()
+    assert item.version == initial_version
+    assert item.outdated
+    assert item.latest_version == "0.4.0"
     assert widget.version.text() == mod_initial_version
     assert widget.version.toolTip() == initial_version
 
@@ -416,19 +561,27 @@ def test_add_items_outdated_and_update(plugin_dialog, qtbot):
     updated_version = "0.4.0"
     mod_updated_version = updated_version.replace('.', '․')  # noqa: RUF001
     assert not widget.update_btn.isVisible()
+    assert item.version == updated_version
     assert widget.version.text() == mod_updated_version
     assert widget.version.toolTip() == updated_version
 
 
 def test_refresh(qtbot, plugin_dialog):
-    with qtbot.waitSignal(plugin_dialog.finished, timeout=500):
-        plugin_dialog.refresh(clear_cache=False)
+    # Every refresh starts its own worker, which always reports `finished`,
+    # so fire them back to back and wait for all of them at once
+    finished = []
 
-    with qtbot.waitSignal(plugin_dialog.finished, timeout=500):
-        plugin_dialog.refresh(clear_cache=True)
+    def on_finished():
+        finished.append(True)
 
-    with qtbot.waitSignal(plugin_dialog.finished, timeout=500):
+    plugin_dialog.finished.connect(on_finished)
+    try:
+        plugin_dialog.refresh(clear_cache=False)
+        plugin_dialog.refresh(clear_cache=True)
         plugin_dialog._refresh_and_clear_cache()
+        qtbot.waitUntil(lambda: len(finished) == 3, timeout=1500)
+    finally:
+        plugin_dialog.finished.disconnect(on_finished)
 
 
 def test_toggle_status(plugin_dialog):
@@ -466,15 +619,18 @@ def test_drop_event(plugin_dialog, tmp_path):
     assert plugin_dialog.direct_entry_edit.text() == str(path_1)
 
 
-def test_installs(qtbot, tmp_virtualenv, plugin_dialog, request):
+def test_installs(qtbot, plugin_dialog, request):
     if "[constructor]" in request.node.name:
         pytest.skip(
             reason="This test is only relevant for constructor-based installs"
         )
 
+    # Only create the virtualenv once we know the test is not skipped
+    tmp_virtualenv = request.getfixturevalue('tmp_virtualenv')
+
     plugin_dialog.set_prefix(str(tmp_virtualenv))
     plugin_dialog.search('requests')
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item = plugin_dialog.available_list.item(0)
     widget = plugin_dialog.available_list.itemWidget(item)
     with qtbot.waitSignal(
@@ -485,7 +641,12 @@ def test_installs(qtbot, tmp_virtualenv, plugin_dialog, request):
     process_finished_data = blocker.args[0]
     assert process_finished_data['action'] == InstallerActions.INSTALL
     assert process_finished_data['pkgs'][0].startswith("requests")
-    qtbot.wait(5000)
+    qtbot.waitUntil(
+        lambda: not plugin_dialog.installer.hasJobs()
+        and plugin_dialog.available_list.count() == 1
+        and plugin_dialog.installed_list.count() == 2,
+        timeout=5000,
+    )
 
 
 @pytest.mark.parametrize(
@@ -493,16 +654,19 @@ def test_installs(qtbot, tmp_virtualenv, plugin_dialog, request):
     [QMessageBox.StandardButton.Cancel, QMessageBox.StandardButton.Ok],
 )
 def test_install_pypi_constructor(
-    qtbot, tmp_virtualenv, plugin_dialog, request, message_return
+    qtbot, plugin_dialog, request, message_return
 ):
     if "no-constructor" in request.node.name:
         pytest.skip(
             reason="This test is only relevant for constructor-based installs"
         )
 
+    # Only create the virtualenv once we know the test is not skipped
+    tmp_virtualenv = request.getfixturevalue('tmp_virtualenv')
+
     plugin_dialog.set_prefix(str(tmp_virtualenv))
     plugin_dialog.search('requests')
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item = plugin_dialog.available_list.item(0)
     widget = plugin_dialog.available_list.itemWidget(item)
     with patch.object(qt_plugin_dialog.QMessageBox, "exec_") as mock:
@@ -512,21 +676,28 @@ def test_install_pypi_constructor(
                 plugin_dialog.installer.processFinished, timeout=60_000
             ):
                 widget.action_button.click()
-            qtbot.wait(5000)
+            qtbot.waitUntil(
+                lambda: not plugin_dialog.installer.hasJobs()
+                and plugin_dialog.available_list.count() == 1,
+                timeout=5000,
+            )
         else:
             widget.action_button.click()
         assert mock.called
 
 
-def test_cancel(qtbot, tmp_virtualenv, plugin_dialog, request):
+def test_cancel(qtbot, plugin_dialog, request):
     if "[constructor]" in request.node.name:
         pytest.skip(
             reason="This test is only relevant for constructor-based installs"
         )
 
+    # Only create the virtualenv once we know the test is not skipped
+    tmp_virtualenv = request.getfixturevalue('tmp_virtualenv')
+
     plugin_dialog.set_prefix(str(tmp_virtualenv))
     plugin_dialog.search('requests')
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item = plugin_dialog.available_list.item(0)
     widget = plugin_dialog.available_list.itemWidget(item)
     with qtbot.waitSignal(
@@ -542,18 +713,21 @@ def test_cancel(qtbot, tmp_virtualenv, plugin_dialog, request):
     assert plugin_dialog.installed_list.count() == 2
 
 
-def test_cancel_all(qtbot, tmp_virtualenv, plugin_dialog, request):
+def test_cancel_all(qtbot, plugin_dialog, request):
     if "[constructor]" in request.node.name:
         pytest.skip(
             reason="This test is only relevant for constructor-based installs"
         )
 
+    # Only create the virtualenv once we know the test is not skipped
+    tmp_virtualenv = request.getfixturevalue('tmp_virtualenv')
+
     plugin_dialog.set_prefix(str(tmp_virtualenv))
     plugin_dialog.search('requests')
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item_1 = plugin_dialog.available_list.item(0)
     plugin_dialog.search('pyzenhub')
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
     item_2 = plugin_dialog.available_list.item(0)
     widget_1 = plugin_dialog.available_list.itemWidget(item_1)
     widget_2 = plugin_dialog.available_list.itemWidget(item_2)
@@ -563,18 +737,21 @@ def test_cancel_all(qtbot, tmp_virtualenv, plugin_dialog, request):
         plugin_dialog.cancel_all_btn.click()
 
     plugin_dialog.search('')
-    qtbot.wait(500)
+    _add_queued_items(plugin_dialog)
 
     assert plugin_dialog.available_list.count() == 2
     assert plugin_dialog.installed_list.count() == 2
 
 
-def test_direct_entry_installs(qtbot, tmp_virtualenv, plugin_dialog, request):
+def test_direct_entry_installs(qtbot, plugin_dialog, request):
     if "[constructor]" in request.node.name:
         pytest.skip(
             reason="This test is only relevant for constructor-based installs"
         )
 
+    # Only create the virtualenv once we know the test is not skipped
+    tmp_virtualenv = request.getfixturevalue('tmp_virtualenv')
+
     plugin_dialog.set_prefix(str(tmp_virtualenv))
     with qtbot.waitSignal(
         plugin_dialog.installer.processFinished, timeout=60_000
@@ -585,7 +762,11 @@ def test_direct_entry_installs(qtbot, tmp_virtualenv, plugin_dialog, request):
     process_finished_data = blocker.args[0]
     assert process_finished_data['action'] == InstallerActions.INSTALL
     assert process_finished_data['pkgs'][0].startswith("requests")
-    qtbot.wait(5000)
+    qtbot.waitUntil(
+        lambda: not plugin_dialog.installer.hasJobs()
+        and plugin_dialog.installed_list.count() == 2,
+        timeout=5000,
+    )
 
 
 @pytest.mark.skipif(
@@ -3,7 +3,10 @@ from unittest.mock import patch
 
 import pytest
 
-from napari_plugin_manager.utils import is_conda_package
+from napari_plugin_manager.utils import (
+    clear_conda_package_cache,
+    is_conda_package,
+)
 
 
 @pytest.mark.parametrize(
@@ -25,3 +28,13 @@ def test_is_conda_package(pkg_name, expected, tmp_path):
 
     with patch.object(sys, 'prefix', tmp_path):
         assert is_conda_package(pkg_name) is expected
+
+
+def test_clear_conda_package_cache(tmp_path):
+    mocked_conda_meta = tmp_path / 'conda-meta'
+    mocked_conda_meta.mkdir()
+    assert not is_conda_package('some-package', prefix=tmp_path)
+
+    (mocked_conda_meta / 'some-package-0.1.1-0.json').touch()
+    clear_conda_package_cache()
+    assert is_conda_package('some-package', prefix=tmp_path)
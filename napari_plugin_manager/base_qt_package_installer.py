@@ -3,35 +3,50 @@ A tool-agnostic installation logic for the plugin manager.
 
 The main object is `InstallerQueue`, a `QProcess` subclass
 with the notion of a job queue. The queued jobs are represented
-by a `deque` of `*InstallerTool` dataclasses that contain the
+by a `dict` of `*InstallerTool` dataclasses that contain the
 executable path, arguments and environment modifications.
 Available actions for each tool are `install`, `uninstall`
 and `cancel`.
 """
 
+import codecs
 import contextlib
 import os
 import sys
-from collections import deque
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from enum import auto
 from functools import lru_cache
-from logging import getLogger
+from itertools import count
+from logging import DEBUG, getLogger
 from pathlib import Path
 from subprocess import call
 from tempfile import gettempdir
-from typing import Deque, Optional, Sequence, Tuple, TypedDict
+from typing import Dict, List, Optional, Sequence, Set, Tuple, TypedDict
 
 from napari.plugins import plugin_manager
 from napari.plugins.npe2api import _user_agent
 from napari.utils.misc import StringEnum
 from napari.utils.translations import trans
 from npe2 import PluginManager
-from qtpy.QtCore import QObject, QProcess, QProcessEnvironment, Signal
+from qtpy.QtCore import (
+    QEventLoop,
+    QObject,
+    QProcess,
+    QProcessEnvironment,
+    QTimer,
+    Signal,
+)
+from qtpy.QtGui import QTextCursor
 from qtpy.QtWidgets import QTextEdit
 
 JobId = int
 log = getLogger(__name__)
+_job_ids = count(1)
+
+if os.name == "nt":
+    # resolving these on Windows involves registry lookups, do it only once
+    _HOME = os.path.expanduser("~")
+    _TEMPDIR = gettempdir()
 
 
 class InstallerActions(StringEnum):
@@ -62,13 +77,8 @@ class AbstractInstallerTool:
     pkgs: Tuple[str, ...]
     origins: Tuple[str, ...] = ()
     prefix: Optional[str] = None
-    process: QProcess = None
-
-    @property
-    def ident(self):
-        return hash(
-            (self.action, *self.pkgs, *self.origins, self.prefix, self.process)
-        )
+    # copied by `dataclasses.replace`, so a merged job keeps the first id
+    ident: JobId = field(default_factory=lambda: next(_job_ids))
 
     # abstract method
     @classmethod
@@ -77,7 +87,7 @@ class AbstractInstallerTool:
         raise NotImplementedError
 
     # abstract method
-    def arguments(self):
+    def arguments(self) -> Tuple[str, ...]:
         "Arguments supplied to the executable"
         raise NotImplementedError
 
@@ -105,22 +115,18 @@ class AbstractInstallerTool:
 
 class PipInstallerTool(AbstractInstallerTool):
     @classmethod
+    @lru_cache
     def available(cls):
         return call([cls.executable(), "-m", "pip", "--version"]) == 0
 
     def arguments(self) -> Tuple[str, ...]:
         args = ['-m', 'pip']
         if self.action == InstallerActions.INSTALL:
-            args += ['install', '-c', self._constraints_file()]
+            args += ['install', *self._constraints_arguments()]
             for origin in self.origins:
                 args += ['--extra-index-url', origin]
         elif self.action == InstallerActions.UPGRADE:
-            args += [
-                'install',
-                '--upgrade',
-                '-c',
-                self._constraints_file(),
-            ]
+            args += ['install', '--upgrade', *self._constraints_arguments()]
             for origin in self.origins:
                 args += ['--extra-index-url', origin]
         elif self.action == InstallerActions.UNINSTALL:
@@ -139,16 +145,40 @@ class PipInstallerTool(AbstractInstallerTool):
         if env is None:
             env = QProcessEnvironment.systemEnvironment()
         env.insert("PIP_USER_AGENT_USER_DATA", _user_agent())
+        if (
+            self.action in (InstallerActions.INSTALL, InstallerActions.UPGRADE)
+            and not self._constraints_arguments()
+        ):
+            self._add_constraints_to_env(env)
+        return env
+
+    def _constraints_arguments(self) -> Tuple[str, ...]:
+        # pip splits PIP_CONSTRAINT on whitespace, so a constraints file in
+        # such a path has to be passed on the command line instead
+        path = self._constraints_file()
+        if any(char.isspace() for char in path):
+            return ('-c', path)
+        return ()
+
+    def _add_constraints_to_env(
+        self, env: QProcessEnvironment
+    ) -> QProcessEnvironment:
+        CONSTRAINT = 'PIP_CONSTRAINT'
+        constraints = (self._constraints_file(),)
+        if existing := env.value(CONSTRAINT, ""):
+            constraints = (*constraints, existing)
+        env.insert(CONSTRAINT, " ".join(constraints))
         return env
 
     @classmethod
-    @lru_cache(maxsize=0)
+    @lru_cache
     def _constraints_file(cls) -> str:
         raise NotImplementedError
 
 
 class CondaInstallerTool(AbstractInstallerTool):
     @classmethod
+    @lru_cache
     def executable(cls):
         bat = ".bat" if os.name == "nt" else ""
         for path in (
@@ -162,6 +192,7 @@ class CondaInstallerTool(AbstractInstallerTool):
         return f'conda{bat}'  # cross our fingers 'conda' is in PATH
 
     @classmethod
+    @lru_cache
     def available(cls):
         executable = cls.executable()
         try:
@@ -170,7 +201,7 @@ class CondaInstallerTool(AbstractInstallerTool):
             return False
 
     def arguments(self) -> Tuple[str, ...]:
-        prefix = self.prefix or self._default_prefix()
+        prefix = str(self.prefix or self._default_prefix())
         if self.action == InstallerActions.UPGRADE:
             args = ['update', '-y', '--prefix', prefix]
         else:
@@ -190,12 +221,11 @@ class CondaInstallerTool(AbstractInstallerTool):
             env.insert('CONDA_VERBOSITY', '3')
         if os.name == "nt":
             if not env.contains("TEMP"):
-                temp = gettempdir()
-                env.insert("TMP", temp)
-                env.insert("TEMP", temp)
+                env.insert("TMP", _TEMPDIR)
+                env.insert("TEMP", _TEMPDIR)
             if not env.contains("USERPROFILE"):
-                env.insert("HOME", os.path.expanduser("~"))
-                env.insert("USERPROFILE", os.path.expanduser("~"))
+                env.insert("HOME", _HOME)
+                env.insert("USERPROFILE", _HOME)
         if sys.platform == 'darwin' and env.contains('PYTHONEXECUTABLE'):
             # Fix for macOS when napari launched from terminal
             # related to https://github.com/napari/napari/pull/5531
@@ -207,8 +237,8 @@ class CondaInstallerTool(AbstractInstallerTool):
     ) -> QProcessEnvironment:
         PINNED = 'CONDA_PINNED_PACKAGES'
         constraints = self.constraints()
-        if env.contains(PINNED):
-            constraints.append(env.value(PINNED))
+        if existing := env.value(PINNED, ""):
+            constraints = (*constraints, existing)
         env.insert(PINNED, "&".join(constraints))
         return env
 
@@ -221,8 +251,51 @@ class CondaInstallerTool(AbstractInstallerTool):
         raise ValueError("Prefix has not been specified!")
 
 
+def clear_installer_tool_cache():
+    """Forget the tool lookups and availability checks done so far.
+
+    They depend on environment variables such as ``CONDA_EXE``, which can
+    change while the application is running.
+    """
+    PipInstallerTool.available.cache_clear()
+    CondaInstallerTool.executable.cache_clear()
+    CondaInstallerTool.available.cache_clear()
+
+
+class JobNotFoundError(ValueError):
+    """Raised when cancelling a job that is not in the queue.
+
+    The message listing the queued jobs is only built when it is shown.
+    """
+
+    def __init__(
+        self, job_id: JobId, queue: Tuple[AbstractInstallerTool, ...]
+    ) -> None:
+        super().__init__(job_id)
+        self.job_id = job_id
+        self.queue = queue
+
+    def __str__(self) -> str:
+        msg = f"No job with id {self.job_id}. Current queue:\n - "
+        msg += "\n - ".join(
+            [
+                f"{item.ident} -> {item.executable()} {item.arguments()}"
+                for item in self.queue
+            ]
+        )
+        return msg
+
+
 class InstallerQueue(QObject):
-    """Queue for installation and uninstallation tasks in the plugin manager."""
+    """Queue for installation and uninstallation tasks in the plugin manager.
+
+    Jobs queued while the queue is idle start after a short delay. The jobs
+    queued within that delay which only differ in their packages (same
+    tool, action, prefix and origins) run in a single process, so they
+    also succeed or fail together. Jobs queued while a process is running
+    each run in a process of their own. Cancelling a job of a running batch
+    stops that process and starts the other jobs of the batch again.
+    """
 
     # emitted when all jobs are finished. Not to be confused with finished,
     # which is emitted when each individual job is finished.
@@ -247,11 +320,35 @@ class InstallerQueue(QObject):
         self, parent: Optional[QObject] = None, prefix: Optional[str] = None
     ) -> None:
         super().__init__(parent)
-        self._queue: Deque[AbstractInstallerTool] = deque()
-        self._current_process: QProcess = None
+        # jobs by id, in the order they were queued
+        self._queue: Dict[JobId, AbstractInstallerTool] = {}
+        # ids of the jobs run by `_current_process`, mapped to the id of
+        # the first job of that batch
+        self._merged_ids: Dict[JobId, JobId] = {}
+        # created when a job starts and released once it is done
+        self._current_process: Optional[QProcess] = None
+        # jobs queued while idle start after a short delay, so the ones
+        # requested together run in the same process
+        self._start_timer = QTimer(self)
+        self._start_timer.setSingleShot(True)
+        self._start_timer.setInterval(50)
+        self._start_timer.timeout.connect(self._process_queue)
+        # ids of the jobs queued within the delay of `_start_timer`, only
+        # these are run together, until they are done
+        self._start_window: Set[JobId] = set()
         self._prefix = prefix
         self._output_widget = None
+        # process output is written to `_output_widget` in batches, one
+        # append per `_output_timer` timeout instead of one per read
+        self._output_buffer: List[str] = []
+        self._output_timer = QTimer(self)
+        self._output_timer.setSingleShot(True)
+        self._output_timer.setInterval(100)
+        self._output_timer.timeout.connect(self._flush_output)
         self._exit_codes = []
+        # npe1 plugins known when the first uninstall finished, kept until
+        # the queue is drained
+        self._npe1_plugins: Optional[set] = None
 
     # -------------------------- Public API ------------------------------
     def install(
@@ -288,7 +385,6 @@ class InstallerQueue(QObject):
             pkgs=pkgs,
             prefix=prefix,
             origins=origins,
-            process=self._create_process(),
             **kwargs,
         )
         return self._queue_item(item)
@@ -327,7 +423,6 @@ class InstallerQueue(QObject):
             pkgs=pkgs,
             prefix=prefix,
             origins=origins,
-            process=self._create_process(),
             **kwargs,
         )
         return self._queue_item(item)
@@ -361,7 +456,6 @@ class InstallerQueue(QObject):
             action=InstallerActions.UNINSTALL,
             pkgs=pkgs,
             prefix=prefix,
-            process=self._create_process(),
             **kwargs,
         )
         return self._queue_item(item)
@@ -375,60 +469,45 @@ class InstallerQueue(QObject):
         job_id : JobId
             Job ID to cancel.
         """
-        for i, item in enumerate(deque(self._queue)):
-            if item.ident == job_id:
-                if i == 0:
-                    # first in queue, currently running
-                    self._queue.remove(item)
-
-                    with contextlib.suppress(RuntimeError):
-                        item.process.finished.disconnect(
-                            self._on_process_finished
-                        )
-                        item.process.errorOccurred.disconnect(
-                            self._on_error_occurred
-                        )
-
-                    self._end_process(item.process)
-                else:
-                    # still pending, just remove from queue
-                    self._queue.remove(item)
-
-                self.processFinished.emit(
-                    {
-                        'exit_code': 1,
-                        'exit_status': 0,
-                        'action': InstallerActions.CANCEL,
-                        'pkgs': item.pkgs,
-                    }
-                )
-                self._process_queue()
-                return
-
-        msg = f"No job with id {job_id}. Current queue:\n - "
-        msg += "\n - ".join(
-            [
-                f"{item.ident} -> {item.executable()} {item.arguments()}"
-                for item in self._queue
-            ]
+        item = self._queue.pop(job_id, None)
+        if item is None:
+            raise JobNotFoundError(job_id, tuple(self._queue.values()))
+        self._start_window.discard(job_id)
+
+        if job_id in self._merged_ids:
+            # currently running, the other jobs of its batch stay queued
+            # and start again without it
+            self._merged_ids = {}
+            process = self._current_process
+            self._current_process = None
+            if process is not None:
+                self._release_process(process)
+                self._end_process(process)
+
+        self._flush_output()
+        self.processFinished.emit(
+            {
+                'exit_code': 1,
+                'exit_status': 0,
+                'action': InstallerActions.CANCEL,
+                'pkgs': item.pkgs,
+            }
         )
-        raise ValueError(msg)
+        self._process_queue()
 
     def cancel_all(self):
         """Terminate all process in the queue and emit the `processFinished` signal."""
-        all_pkgs = []
-        for item in deque(self._queue):
-            all_pkgs.extend(item.pkgs)
-            process = item.process
-
-            with contextlib.suppress(RuntimeError):
-                process.finished.disconnect(self._on_process_finished)
-                process.errorOccurred.disconnect(self._on_error_occurred)
-
+        all_pkgs = [pkg for item in self._queue.values() for pkg in item.pkgs]
+        process = self._current_process
+        if process is not None:
+            self._release_process(process)
             self._end_process(process)
 
         self._queue.clear()
+        self._start_window.clear()
+        self._merged_ids = {}
         self._current_process = None
+        self._flush_output()
         self.processFinished.emit(
             {
                 'exit_code': 1,
@@ -443,15 +522,33 @@ class InstallerQueue(QObject):
     def waitForFinished(self, msecs: int = 10000) -> bool:
         """Block and wait for all jobs to finish.
 
+        Qt events keep being processed while waiting.
+
         Parameters
         ----------
         msecs : int, optional
-            Time to wait, by default 10000
+            Total time to wait for the whole queue, by default 10000
+
+        Returns
+        -------
+        bool
+            True if all jobs finished in time.
         """
-        while self.hasJobs():
-            if self._current_process is not None:
-                self._current_process.waitForFinished(msecs)
-        return True
+        if not self.hasJobs():
+            return True
+
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        self.allFinished.connect(loop.quit)
+        timer.start(msecs)
+        try:
+            loop.exec_()
+        finally:
+            timer.stop()
+            self.allFinished.disconnect(loop.quit)
+        return not self.hasJobs()
 
     def hasJobs(self) -> bool:
         """True if there are jobs remaining in the queue."""
@@ -463,6 +560,8 @@ class InstallerQueue(QObject):
 
     def set_output_widget(self, output_widget: QTextEdit):
         if output_widget:
+            # pending output goes to the widget it was logged for
+            self._flush_output()
             self._output_widget = output_widget
 
     # -------------------------- Private methods ------------------------------
@@ -471,14 +570,50 @@ class InstallerQueue(QObject):
         process.setProcessChannelMode(QProcess.MergedChannels)
         process.readyReadStandardOutput.connect(self._on_stdout_ready)
         process.readyReadStandardError.connect(self._on_stderr_ready)
+        process.started.connect(self.started)
         process.finished.connect(self._on_process_finished)
         process.errorOccurred.connect(self._on_error_occurred)
+        # output can be split in the middle of a multibyte character, so
+        # each channel keeps its decoder state between reads
+        process._stdout_decoder = codecs.getincrementaldecoder('utf-8')(
+            errors='replace'
+        )
+        process._stderr_decoder = codecs.getincrementaldecoder('utf-8')(
+            errors='replace'
+        )
         return process
 
+    def _release_process(self, process: QProcess):
+        # a finished or cancelled process must not report to the queue
+        # anymore, and is deleted once it has actually stopped
+        with contextlib.suppress(RuntimeError):
+            process.finished.disconnect(self._on_process_finished)
+            process.errorOccurred.disconnect(self._on_error_occurred)
+        if process.state() == QProcess.NotRunning:
+            process.deleteLater()
+        else:
+            process.finished.connect(process.deleteLater)
+
     def _log(self, msg: str):
         log.debug(msg)
+        self._append_output(msg)
+
+    def _append_output(self, msg: str):
         if self._output_widget:
-            self._output_widget.append(msg)
+            self._output_buffer.append(msg)
+            if not self._output_timer.isActive():
+                self._output_timer.start()
+
+    def _flush_output(self):
+        self._output_timer.stop()
+        if self._output_widget and self._output_buffer:
+            # plain text like the messages themselves, each on a new line
+            text = "\n".join(self._output_buffer)
+            if not self._output_widget.document().isEmpty():
+                text = "\n" + text
+            self._output_widget.moveCursor(QTextCursor.End)
+            self._output_widget.insertPlainText(text)
+        self._output_buffer.clear()
 
     def _get_tool(self, tool: InstallerTools):
         if tool == InstallerTools.PIP:
@@ -505,35 +640,76 @@ class InstallerQueue(QObject):
         )
 
     def _queue_item(self, item: AbstractInstallerTool) -> JobId:
-        self._queue.append(item)
-        self._process_queue()
+        # jobs may start later, report unsupported actions to the caller now
+        item.arguments()
+        self._queue[item.ident] = item
+        if self._current_process is None:
+            self._start_window.add(item.ident)
+            self._start_timer.start()
         return item.ident
 
     def _process_queue(self):
+        self._start_timer.stop()
         if not self._queue:
+            self._npe1_plugins = None
             self.allFinished.emit(tuple(self._exit_codes))
             self._exit_codes = []
             return
 
-        tool = self._queue[0]
-        process = tool.process
+        if self._current_process is None:
+            # Jobs queued together with the first one that only differ in
+            # their packages run in the same process, so the tool resolves
+            # once
+            batch = self._next_batch()
+            tool = batch[0]
+            self._merged_ids = {job.ident: tool.ident for job in batch}
+            if len(batch) > 1:
+                tool = replace(
+                    tool, pkgs=tuple(pkg for job in batch for pkg in job.pkgs)
+                )
+
+            program = str(tool.executable())
+            env = tool.environment()
+            args = list(tool.arguments())
 
-        if process.state() != QProcess.Running:
-            process.setProgram(str(tool.executable()))
-            process.setProcessEnvironment(tool.environment())
-            process.setArguments([str(arg) for arg in tool.arguments()])
-            process.started.connect(self.started)
+            process = self._create_process()
+            process.setProgram(program)
+            process.setProcessEnvironment(env)
+            process.setArguments(args)
 
             self._log(
                 trans._(
                     "Starting '{program}' with args {args}",
-                    program=process.program(),
-                    args=process.arguments(),
+                    program=program,
+                    args=args,
                 )
             )
 
-            process.start()
             self._current_process = process
+            process.start()
+
+    def _next_batch(self) -> List[AbstractInstallerTool]:
+        """Jobs at the front of the queue that can run in a single process."""
+        jobs = iter(self._queue.values())
+        first = next(jobs)
+        batch = [first]
+        if first.ident not in self._start_window:
+            return batch
+        for item in jobs:
+            if (
+                item.ident not in self._start_window
+                or type(item) is not type(first)
+                or item.action != first.action
+                or item.prefix != first.prefix
+                or tuple(item.origins) != tuple(first.origins)
+            ):
+                break
+            batch.append(item)
+        return batch
+
+    def _running_jobs(self) -> List[AbstractInstallerTool]:
+        """Jobs run by `_current_process`, in the order they were queued."""
+        return [self._queue[ident] for ident in self._merged_ids]
 
     def _end_process(self, process: QProcess):
         if os.name == 'nt':
@@ -543,30 +719,25 @@ class InstallerQueue(QObject):
         else:
             process.terminate()
 
-        if self._output_widget:
-            self._output_widget.append(
-                trans._("\nTask was cancelled by the user.")
-            )
+        self._append_output(trans._("\nTask was cancelled by the user."))
 
     def _on_process_finished(
         self, exit_code: int, exit_status: QProcess.ExitStatus
     ):
-        try:
-            current = self._queue[0]
-        except IndexError:
-            current = None
+        batch = self._running_jobs()
         if (
-            current
-            and current.action == InstallerActions.UNINSTALL
+            batch
+            and batch[0].action == InstallerActions.UNINSTALL
             and exit_status == QProcess.ExitStatus.NormalExit
             and exit_code == 0
         ):
             pm2 = PluginManager.instance()
-            npe1_plugins = set(plugin_manager.iter_available())
-            for pkg in current.pkgs:
+            if self._npe1_plugins is None:
+                self._npe1_plugins = set(plugin_manager.iter_available())
+            for pkg in (pkg for job in batch for pkg in job.pkgs):
                 if pkg in pm2:
                     pm2.unregister(pkg)
-                elif pkg in npe1_plugins:
+                elif pkg in self._npe1_plugins:
                     plugin_manager.unregister(pkg)
                 else:
                     log.warning(
@@ -585,9 +756,15 @@ class InstallerQueue(QObject):
         exit_status: Optional[QProcess.ExitStatus] = None,
         error: Optional[QProcess.ProcessError] = None,
     ):
-        item = None
-        with contextlib.suppress(IndexError):
-            item = self._queue.popleft()
+        batch = self._running_jobs()
+        self._merged_ids = {}
+        for item in batch:
+            del self._queue[item.ident]
+            self._start_window.discard(item.ident)
+        if self._current_process is not None:
+            self._finish_output(self._current_process)
+            self._release_process(self._current_process)
+            self._current_process = None
 
         if error:
             msg = trans._(
@@ -600,7 +777,7 @@ class InstallerQueue(QObject):
                 exit_status=exit_status,
             )
 
-        if item is not None:
+        for item in batch:
             self.processFinished.emit(
                 {
                     'exit_code': exit_code,
@@ -612,18 +789,46 @@ class InstallerQueue(QObject):
             self._exit_codes.append(exit_code)
 
         self._log(msg)
+        if len(batch) > 1 and (error or exit_code):
+            self._log(
+                trans._(
+                    "The jobs for {pkgs} ran in a single process and failed together.",
+                    pkgs=', '.join(' '.join(item.pkgs) for item in batch),
+                )
+            )
+        self._flush_output()
         self._process_queue()
 
+    def _output_wanted(self) -> bool:
+        return self._output_widget is not None or log.isEnabledFor(DEBUG)
+
+    def _finish_output(self, process: QProcess):
+        # output ending in the middle of a multibyte character is only
+        # returned by the decoders once they know no more bytes will come
+        if self._output_wanted():
+            for decoder in (
+                process._stdout_decoder,
+                process._stderr_decoder,
+            ):
+                text = decoder.decode(b'', final=True)
+                if text:
+                    self._log(text)
+
     def _on_stdout_ready(self):
-        if self._current_process is not None:
-            text = (
-                self._current_process.readAllStandardOutput().data().decode()
-            )
-            if text:
-                self._log(text)
+        process = self._current_process
+        if process is not None:
+            # always drain the channel, but only decode what will be shown
+            data = process.readAllStandardOutput().data()
+            if self._output_wanted():
+                text = process._stdout_decoder.decode(data)
+                if text:
+                    self._log(text)
 
     def _on_stderr_ready(self):
-        if self._current_process is not None:
-            text = self._current_process.readAllStandardError().data().decode()
-            if text:
-                self._log(text)
+        process = self._current_process
+        if process is not None:
+            data = process.readAllStandardError().data()
+            if self._output_wanted():
+                text = process._stderr_decoder.decode(data)
+                if text:
+                    self._log(text)
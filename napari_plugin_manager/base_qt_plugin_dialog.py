@@ -2,7 +2,8 @@ import contextlib
 import importlib.metadata
 import os
 import webbrowser
-from functools import partial
+from collections import deque
+from functools import lru_cache
 from typing import (
     Any,
     Dict,
@@ -25,6 +26,7 @@ from qtpy.QtGui import (
     QIcon,
     QKeySequence,
     QMovie,
+    QPixmap,
     QShortcut,
 )
 from qtpy.QtWidgets import (
@@ -36,6 +38,7 @@ from qtpy.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QListWidget,
     QListWidgetItem,
     QMenu,
@@ -54,12 +57,77 @@ from napari_plugin_manager.base_qt_package_installer import (
     InstallerQueue,
     InstallerTools,
     ProcessFinishedData,
+    clear_installer_tool_cache,
 )
 from napari_plugin_manager.qt_widgets import ClickableLabel
-from napari_plugin_manager.utils import is_conda_package
+from napari_plugin_manager.utils import (
+    clear_conda_package_cache,
+    is_conda_package,
+)
 
 CONDA = 'Conda'
 PYPI = 'PyPI'
+# Versions are displayed with 'one dot leader' characters instead of periods
+_VERSION_DOTS = str.maketrans({'.': '․'})  # noqa: RUF001
+# Size policies shared by all plugin items, widgets keep their own copy
+_FIXED_SIZE_POLICY = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
+_MINIMUM_HEIGHT_SIZE_POLICY = QSizePolicy(
+    QSizePolicy.Preferred, QSizePolicy.Minimum
+)
+_PREFERRED_SIZE_POLICY = QSizePolicy(
+    QSizePolicy.Preferred, QSizePolicy.Preferred
+)
+_STRETCH_SIZE_POLICY = QSizePolicy(
+    QSizePolicy.Preferred, QSizePolicy.Preferred
+)
+_STRETCH_SIZE_POLICY.setHorizontalStretch(1)
+
+
+@lru_cache(maxsize=4096)
+def _parse_version(version: str):
+    # Installed plugins are compared against the same versions on every
+    # refresh, parse each version string once
+    return parse_version(version)
+
+
+class _RowState:
+    """State of a plugin list row, stored as `item._row` on its item."""
+
+    __slots__ = ('version', 'filter_text', 'outdated', 'latest_version')
+
+    def __init__(self, version: str, filter_text: str) -> None:
+        self.version = version
+        self.filter_text = filter_text
+        self.outdated = False
+        self.latest_version: Optional[str] = None
+
+
+class _PluginListWidgetItem(QListWidgetItem):
+    """Plugin list item keeping its `version` and update state in `_row`."""
+
+    @property
+    def version(self) -> str:
+        return self._row.version
+
+    @version.setter
+    def version(self, version: str):
+        self._row.version = version
+
+    @property
+    def outdated(self) -> bool:
+        return self._row.outdated
+
+    @outdated.setter
+    def outdated(self, outdated: bool):
+        self._row.outdated = outdated
+
+    @property
+    def latest_version(self) -> Optional[str]:
+        return self._row.latest_version
+
+    @latest_version.setter
+    def latest_version(self, latest_version: Optional[str]):
+        self._row.latest_version = latest_version
 
 
 class PackageMetadataProtocol(Protocol):
@@ -174,12 +242,7 @@ class BasePluginListItem(QFrame):
 
         self.plugin_name.setText(name)
 
-        if len(versions_pypi) > 0:
-            self._populate_version_dropdown(PYPI)
-        else:
-            self._populate_version_dropdown(CONDA)
-
-        mod_version = version.replace('.', '․')  # noqa: RUF001
+        mod_version = version.translate(_VERSION_DOTS)
         self.version.setWordWrap(True)
         self.version.setText(mod_version)
         self.version.setToolTip(version)
@@ -195,7 +258,6 @@ class BasePluginListItem(QFrame):
 
         self._handle_plugin_api_version(plugin_api_version)
         self._set_installed(installed, package_name)
-        self._populate_version_dropdown(self.get_installer_source())
 
     def _warning_icon(self) -> QIcon:
         """
@@ -207,6 +269,17 @@ class BasePluginListItem(QFrame):
         """
         raise NotImplementedError
 
+    def _warning_pixmap(self) -> QPixmap:
+        """
+        Pixmap shown by the warning tooltip.
+
+        Returns
+        -------
+        The warning icon rendered at 15x15. Subclasses can override this to
+        share a pixmap rendered once between all plugin items.
+        """
+        return self._warning_icon().pixmap(15, 15)
+
     def _collapsed_icon(self) -> QIcon:
         """
         Icon to be used to indicate the plugin item info collapsible section can be collapsed.
@@ -261,6 +334,9 @@ class BasePluginListItem(QFrame):
     def _is_main_app_conda_package(self):
         return is_conda_package(self.BASE_PACKAGE_NAME)
 
+    def _open_home_page(self):
+        webbrowser.open(self.url)
+
     def _set_installed(self, installed: bool, package_name):
         if installed:
             if is_conda_package(package_name):
@@ -349,13 +425,7 @@ class BasePluginListItem(QFrame):
         self.enabled_checkbox.setText("")
         self.enabled_checkbox.stateChanged.connect(self._on_enabled_checkbox)
 
-        sizePolicy = QSizePolicy(QSizePolicy.Fixed, QSizePolicy.Fixed)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.enabled_checkbox.sizePolicy().hasHeightForWidth()
-        )
-        self.enabled_checkbox.setSizePolicy(sizePolicy)
+        self.enabled_checkbox.setSizePolicy(_FIXED_SIZE_POLICY)
         self.enabled_checkbox.setMinimumSize(QSize(20, 0))
 
         # Plugin name
@@ -377,25 +447,18 @@ class BasePluginListItem(QFrame):
         else:
             self.plugin_name.setObjectName('plugin_name')
 
-        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Minimum)
-        sizePolicy.setHorizontalStretch(0)
-        sizePolicy.setVerticalStretch(0)
-        sizePolicy.setHeightForWidth(
-            self.plugin_name.sizePolicy().hasHeightForWidth()
-        )
-        self.plugin_name.setSizePolicy(sizePolicy)
+        self.plugin_name.setSizePolicy(_MINIMUM_HEIGHT_SIZE_POLICY)
 
         # Warning icon
-        icon = self._warning_icon()
         self.warning_tooltip = self._warning_tooltip()
 
-        self.warning_tooltip.setPixmap(icon.pixmap(15, 15))
+        self.warning_tooltip.setPixmap(self._warning_pixmap())
         self.warning_tooltip.setVisible(False)
 
         # Item status
         self.item_status = QLabel(self)
         self.item_status.setObjectName("small_italic_text")
-        self.item_status.setSizePolicy(sizePolicy)
+        self.item_status.setSizePolicy(_MINIMUM_HEIGHT_SIZE_POLICY)
 
         # Summary
         self.summary = QElidingLabel(parent=self)
@@ -406,39 +469,33 @@ class BasePluginListItem(QFrame):
         font_summary.setPointSize(10)
         self.summary.setFont(font_summary)
 
-        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        sizePolicy.setHorizontalStretch(1)
-        sizePolicy.setVerticalStretch(0)
-        self.summary.setSizePolicy(sizePolicy)
+        self.summary.setSizePolicy(_STRETCH_SIZE_POLICY)
         self.summary.setContentsMargins(0, -2, 0, -2)
 
         # Package author
         self.package_author = QElidingLabel(self)
         self.package_author.setObjectName('author_text')
         self.package_author.setWordWrap(True)
-        self.package_author.setSizePolicy(sizePolicy)
+        self.package_author.setSizePolicy(_STRETCH_SIZE_POLICY)
 
         # Update button
         self.update_btn = QPushButton('Update', self)
         self.update_btn.setObjectName("install_button")
         self.update_btn.setVisible(False)
         self.update_btn.clicked.connect(self._update_requested)
-        sizePolicy.setRetainSizeWhenHidden(True)
-        sizePolicy = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        self.update_btn.setSizePolicy(sizePolicy)
+        self.update_btn.setSizePolicy(_PREFERRED_SIZE_POLICY)
         self.update_btn.clicked.connect(self._update_requested)
 
         # Action Button
         self.action_button = QPushButton(self)
         self.action_button.setFixedWidth(70)
-        sizePolicy1 = QSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
-        self.action_button.setSizePolicy(sizePolicy1)
+        self.action_button.setSizePolicy(_PREFERRED_SIZE_POLICY)
         self.action_button.clicked.connect(self._action_requested)
 
         # Cancel
         self.cancel_btn = QPushButton("Cancel", self)
         self.cancel_btn.setObjectName("remove_button")
-        self.cancel_btn.setSizePolicy(sizePolicy)
+        self.cancel_btn.setSizePolicy(_PREFERRED_SIZE_POLICY)
         self.cancel_btn.setFixedWidth(70)
         self.cancel_btn.clicked.connect(self._cancel_requested)
 
@@ -461,7 +518,7 @@ class BasePluginListItem(QFrame):
         self.install_info_button.content().layout().setSpacing(0)
         self.install_info_button.layout().setContentsMargins(0, 0, 0, 0)
         self.install_info_button.layout().setSpacing(2)
-        self.install_info_button.setSizePolicy(sizePolicy)
+        self.install_info_button.setSizePolicy(_PREFERRED_SIZE_POLICY)
 
         # Information widget for available packages
         self.info_choice_wdg = QWidget(self)
@@ -581,8 +638,7 @@ class BasePluginListItem(QFrame):
         else:
             versions = self._versions_conda
         self.version_choice_dropdown.clear()
-        for version in versions:
-            self.version_choice_dropdown.addItem(version)
+        self.version_choice_dropdown.addItems(versions)
 
     def _on_enabled_checkbox(self, state: Qt.CheckState) -> None:
         """
@@ -684,8 +740,14 @@ class BaseQPluginList(QListWidget):
         self._remove_list = []
         self._data = []
         self._initial_height = None
+        # package name -> list items, to avoid scanning the list by name.
+        # A package has several items when it provides several plugins.
+        self._items_by_name: Dict[str, List[QListWidgetItem]] = {}
 
         self.setSortingEnabled(True)
+        # Rows can be expanded, so their sizes are not uniform; lay them out
+        # in batches so long lists do not block on one full layout pass
+        self.setLayoutMode(QListView.LayoutMode.Batched)
 
     def _trans(self, text: str, **kwargs) -> str:
         """
@@ -704,18 +766,28 @@ class BaseQPluginList(QListWidget):
         """
         raise NotImplementedError
 
+    def begin_bulk_add(self):
+        """Stop sorting and repainting the list while many items are added.
+
+        Every call must be followed by `end_bulk_add`.
+        """
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+
+    def end_bulk_add(self):
+        """Sort and repaint the list once after a `begin_bulk_add`."""
+        self.setSortingEnabled(True)
+        self.sortItems()
+        self.setUpdatesEnabled(True)
+
     def count_visible(self) -> int:
         """Return the number of visible items.
 
         Visible items are the result of the normal `count` method minus
         any hidden items.
         """
-        hidden = 0
         count = self.count()
-        for i in range(count):
-            item = self.item(i)
-            hidden += item.isHidden()
-
+        hidden = sum(self.isRowHidden(i) for i in range(count))
         return count - hidden
 
     @Slot(tuple)
@@ -729,17 +801,18 @@ class BaseQPluginList(QListWidget):
     ):
         pkg_name = project_info.metadata.name
         # don't add duplicates
-        if (
-            self.findItems(pkg_name, Qt.MatchFlag.MatchFixedString)
-            and not plugin_name
-        ):
+        if pkg_name in self._items_by_name and not plugin_name:
             return
 
-        # including summary here for sake of filtering below.
+        # The item text is hidden behind the widget and only used as the
+        # sort key, the summary is kept apart for the sake of filtering below.
         searchable_text = f"{pkg_name} {project_info.display_name} {project_info.metadata.summary}"
-        item = QListWidgetItem(searchable_text, self)
-        item.version = project_info.metadata.version
+        item = _PluginListWidgetItem(pkg_name, self)
+        item._row = _RowState(
+            project_info.metadata.version, searchable_text.lower()
+        )
         super().addItem(item)
+        self._items_by_name.setdefault(pkg_name, []).append(item)
         widg = self.PLUGIN_LIST_ITEM_CLASS(
             item=item,
             package_name=pkg_name,
@@ -763,9 +836,7 @@ class BaseQPluginList(QListWidget):
         self.setItemWidget(item, widg)
 
         if project_info.metadata.home_page:
-            widg.plugin_name.clicked.connect(
-                partial(webbrowser.open, project_info.metadata.home_page)
-            )
+            widg.plugin_name.clicked.connect(widg._open_home_page)
 
         widg.actionRequested.connect(self.handle_action)
         item.setSizeHint(item.widget.size())
@@ -778,27 +849,31 @@ class BaseQPluginList(QListWidget):
         )
 
     def removeItem(self, name):
-        count = self.count()
-        for i in range(count):
-            item = self.item(i)
-            if item.widget.name == name:
-                self.takeItem(i)
-                break
+        items = self._items_by_name.get(name)
+        if items:
+            item = items.pop(0)
+            if not items:
+                del self._items_by_name[name]
+            self.takeItem(self.row(item))
+
+    def clear(self):
+        self._items_by_name.clear()
+        super().clear()
 
     def refreshItem(self, name, version=None):
-        count = self.count()
-        for i in range(count):
-            item = self.item(i)
-            if item.widget.name == name:
-                if version is not None:
-                    item.version = version
-                    mod_version = version.replace('.', '․')  # noqa: RUF001
-                    item.widget.version.setText(mod_version)
-                    item.widget.version.setToolTip(version)
-                item.widget.set_busy('', InstallerActions.CANCEL)
-                if item.text().startswith(self._SORT_ORDER_PREFIX):
-                    item.setText(item.text()[len(self._SORT_ORDER_PREFIX) :])
-                break
+        items = self._items_by_name.get(name)
+        if items:
+            item = items[0]
+            # Relabelling the eliding label relayouts it, only do it on change
+            row = item._row
+            if version is not None and version != row.version:
+                row.version = version
+                mod_version = version.translate(_VERSION_DOTS)
+                item.widget.version.setText(mod_version)
+                item.widget.version.setToolTip(version)
+            item.widget.set_busy('', InstallerActions.CANCEL)
+            if item.text().startswith(self._SORT_ORDER_PREFIX):
+                item.setText(item.text()[len(self._SORT_ORDER_PREFIX) :])
 
     def _resize_pluginlistitem(self, item):
         """Resize the plugin list item, especially after toggling QCollapsible."""
@@ -864,8 +939,9 @@ class BaseQPluginList(QListWidget):
             self.scrollToTop()
 
         if action_name == InstallerActions.UPGRADE:
-            if hasattr(item, 'latest_version'):
-                pkg_name += f"=={item.latest_version}"
+            latest_version = item._row.latest_version
+            if latest_version is not None:
+                pkg_name += f"=={latest_version}"
 
             widget.set_busy(self._trans("updating..."), action_name)
             widget.update_btn.setDisabled(True)
@@ -921,18 +997,16 @@ class BaseQPluginList(QListWidget):
         if not is_available:
             return
 
-        for item in self.findItems(
-            metadata.name, Qt.MatchFlag.MatchStartsWith
-        ):
-            current = item.version
+        for item in self._items_by_name.get(metadata.name, ()):
+            row = item._row
             latest = metadata.version
-            is_marked_outdated = getattr(item, 'outdated', False)
-            if parse_version(current) >= parse_version(latest):
+            is_marked_outdated = row.outdated
+            if _parse_version(row.version) >= _parse_version(latest):
                 # currently is up to date
                 if is_marked_outdated:
                     # previously marked as outdated, need to update item
                     # `outdated` state and hide item widget `update_btn`
-                    item.outdated = False
+                    row.outdated = False
                     widg = self.itemWidget(item)
                     widg.update_btn.setVisible(False)
                 continue
@@ -940,8 +1014,8 @@ class BaseQPluginList(QListWidget):
                 # already tagged it
                 continue
 
-            item.outdated = True
-            item.latest_version = latest
+            row.outdated = True
+            row.latest_version = latest
             widg = self.itemWidget(item)
             widg.update_btn.setVisible(True)
             widg.update_btn.setText(
@@ -955,10 +1029,12 @@ class BaseQPluginList(QListWidget):
         This will disable the item and the install button and add a warning
         icon with a hover tooltip.
         """
-        for item in self.findItems(
-            metadata.name, Qt.MatchFlag.MatchStartsWith
-        ):
+        for item in self._items_by_name.get(metadata.name, ()):
             widget = self.itemWidget(item)
+            if widget.objectName() == "unavailable":
+                # Already tagged, skip repolishing the item style
+                continue
+
             widget.show_warning(
                 self._trans(
                     "Plugin not yet available for installation within the bundle application"
@@ -972,40 +1048,28 @@ class BaseQPluginList(QListWidget):
 
     def filter(self, text: str, starts_with_chars: int = 1):
         """Filter items to those containing `text`."""
+        # Rows are hidden by index, `QListWidgetItem.setHidden` has to look
+        # up the row of the item first
         if text:
-            # PySide has some issues, so we compare using id
-            # See: https://bugreports.qt.io/browse/PYSIDE-74
-            flag = (
-                Qt.MatchFlag.MatchStartsWith
-                if len(text) <= starts_with_chars
-                else Qt.MatchFlag.MatchContains
-            )
-            if len(text) <= starts_with_chars:
-                flag = Qt.MatchFlag.MatchStartsWith
-                queries = (text, f'{self._package_name}-{text}')
-            else:
-                flag = Qt.MatchFlag.MatchContains
-                queries = (text,)
-
-            shown = {
-                id(it)
-                for query in queries
-                for it in self.findItems(query, flag)
-            }
+            # Match against the lowercased text stored on each item instead
+            # of asking Qt to search the whole list for every query
+            text = text.lower()
+            starts_with = len(text) <= starts_with_chars
+            prefixes = (text, f'{self._package_name}-{text}'.lower())
             for i in range(self.count()):
                 item = self.item(i)
-                item.setHidden(
-                    id(item) not in shown and not item.widget.is_busy()
-                )
+                if starts_with:
+                    match = item._row.filter_text.startswith(prefixes)
+                else:
+                    match = text in item._row.filter_text
+                self.setRowHidden(i, not match and not item.widget.is_busy())
         else:
             for i in range(self.count()):
-                item = self.item(i)
-                item.setHidden(False)
+                self.setRowHidden(i, False)
 
     def hideAll(self):
         for i in range(self.count()):
-            item = self.item(i)
-            item.setHidden(not item.widget.is_busy())
+            self.setRowHidden(i, not self.item(i).widget.is_busy())
 
 
 class BaseQtPluginDialog(QDialog):
@@ -1029,8 +1093,12 @@ class BaseQtPluginDialog(QDialog):
     INSTALLER_QUEUE_CLASS = InstallerQueue
     BASE_PACKAGE_NAME = ''
     MAX_PLUGIN_SEARCH_ITEMS = 35
+    # Most queued plugins handled in a single `_add_items` call
+    _ADD_ITEMS_CHUNK_SIZE = 200
 
     finished = Signal()
+    # Emitted once every item queued for the lists has been added to them
+    itemsPopulated = Signal()
 
     def __init__(self, parent=None, prefix=None) -> None:
         super().__init__(parent)
@@ -1047,10 +1115,9 @@ class BaseQtPluginDialog(QDialog):
         self.available_set = set()
         self._prefix = prefix
         self._first_open = True
-        self._plugin_queue = []  # Store plugin data to be added
+        self._plugin_queue = deque()  # Store plugin data to be added
         self._plugin_data = []  # Store all plugin data
         self._filter_texts = []
-        self._filter_idxs_cache = set()
         self.worker = None
         self._plugin_data_map = {}
         self._add_items_timer = QTimer(self)
@@ -1067,6 +1134,12 @@ class BaseQtPluginDialog(QDialog):
         self._add_items_timer.setInterval(61)  # ms
         self._add_items_timer.timeout.connect(self._add_items)
 
+        # Search once typing pauses instead of on every character typed
+        self._search_timer = QTimer(self)
+        self._search_timer.setInterval(250)  # ms
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.search)
+
         self.installer = self.INSTALLER_QUEUE_CLASS(parent=self, prefix=prefix)
         self.setWindowTitle(self._trans('Plugin Manager'))
         self._setup_ui()
@@ -1144,6 +1217,7 @@ class BaseQtPluginDialog(QDialog):
     def _on_process_finished(self, process_finished_data: ProcessFinishedData):
         action = process_finished_data['action']
         exit_code = process_finished_data['exit_code']
+        clear_conda_package_cache()
         pkg_names = [
             pkg.split('==')[0] for pkg in process_finished_data['pkgs']
         ]
@@ -1254,7 +1328,7 @@ class BaseQtPluginDialog(QDialog):
     def _add_to_available(self, pkg_name):
         self._add_items_timer.stop()
         if self._plugin_queue is not None:
-            self._plugin_queue.insert(0, self._plugin_data_map[pkg_name])
+            self._plugin_queue.appendleft(self._plugin_data_map[pkg_name])
 
         self._add_items_timer.start()
         self._update_plugin_count()
@@ -1280,8 +1354,9 @@ class BaseQtPluginDialog(QDialog):
         """
         Fetch plugins available for installation.
 
-        This should call `_handle_yield` in order to queue the addition of plugins available
-        for installation to the corresponding list (`self.available_list`).
+        This should call `_handle_yield` (or `_handle_yield_batch`) in order to queue the
+        addition of plugins available for installation to the corresponding list
+        (`self.available_list`).
 
         Parameters
         ----------
@@ -1384,7 +1459,9 @@ class BaseQtPluginDialog(QDialog):
         )
         self.packages_search.setMaximumWidth(350)
         self.packages_search.setClearButtonEnabled(True)
-        self.packages_search.textChanged.connect(self.search)
+        self.packages_search.textChanged.connect(
+            lambda: self._search_timer.start()
+        )
 
         self.import_button = QPushButton(self._trans('Import'), self)
         self.import_button.setObjectName("import_button")
@@ -1618,57 +1695,73 @@ class BaseQtPluginDialog(QDialog):
 
     def _add_items(self):
         """
-        Add items to the lists by `batch_size` using a timer to add a pause
+        Add items to the lists by chunks using a timer to add a pause
         and prevent freezing the UI.
         """
-        if (
-            len(self._plugin_queue) == 0
-            or self.available_list.count_visible()
-            >= self.MAX_PLUGIN_SEARCH_ITEMS
-        ):
+        if not self._plugin_queue:
+            # Nothing to add for now, `search` and `_add_to_available`
+            # start the timer again when there is
+            self._add_items_timer.stop()
             if (
                 self.installed_list.count() + self.available_list.count()
                 == len(self._plugin_data)
                 and self.available_list.count() != 0
+                and not self.isVisible()
             ):
-                self._add_items_timer.stop()
-                if not self.isVisible():
-                    self._show_info(
-                        self._trans(
-                            'Plugin Manager: All available plugins loaded\n'
-                        )
+                self._show_info(
+                    self._trans(
+                        'Plugin Manager: All available plugins loaded\n'
                     )
+                )
 
             return
 
-        batch_size = 2
-        for _ in range(batch_size):
-            data = self._plugin_queue.pop(0)
-            metadata, is_available_in_conda, extra_info = data
-            display_name = extra_info.get('display_name', metadata.name)
-            if metadata.name in self.already_installed:
-                self.installed_list.tag_outdated(
-                    metadata, is_available_in_conda
-                )
-            else:
-                if metadata.name not in self.available_set:
-                    self.available_set.add(metadata.name)
-                    self.available_list.addItem(
-                        self.PROJECT_INFO_VERSION_CLASS(
-                            display_name=display_name,
-                            pypi_versions=extra_info['pypi_versions'],
-                            conda_versions=extra_info['conda_versions'],
-                            metadata=metadata,
-                        )
+        free_slots = (
+            self.MAX_PLUGIN_SEARCH_ITEMS - self.available_list.count_visible()
+        )
+        if free_slots <= 0:
+            # Keep polling, rows freed by installs or filtering are filled
+            # again on a later tick
+            return
+
+        # Fill the remaining search result slots in one go, sorting and
+        # repainting the available list once instead of after every item
+        self.available_list.begin_bulk_add()
+        try:
+            for _ in range(self._ADD_ITEMS_CHUNK_SIZE):
+                if free_slots <= 0:
+                    break
+                data = self._plugin_queue.popleft()
+                metadata, is_available_in_conda, extra_info = data
+                display_name = extra_info.get('display_name', metadata.name)
+                if metadata.name in self.already_installed:
+                    self.installed_list.tag_outdated(
+                        metadata, is_available_in_conda
                     )
-                if self._on_bundle() and not is_available_in_conda:
-                    self.available_list.tag_unavailable(metadata)
+                else:
+                    if metadata.name not in self.available_set:
+                        self.available_set.add(metadata.name)
+                        self.available_list.addItem(
+                            self.PROJECT_INFO_VERSION_CLASS(
+                                display_name=display_name,
+                                pypi_versions=extra_info['pypi_versions'],
+                                conda_versions=extra_info['conda_versions'],
+                                metadata=metadata,
+                            )
+                        )
+                        free_slots -= 1
+                    if self._on_bundle() and not is_available_in_conda:
+                        self.available_list.tag_unavailable(metadata)
 
-            if len(self._plugin_queue) == 0:
-                self._tag_outdated_plugins()
-                break
+                if len(self._plugin_queue) == 0:
+                    self._tag_outdated_plugins()
+                    break
+        finally:
+            self.available_list.end_bulk_add()
 
         self._update_plugin_count()
+        if len(self._plugin_queue) == 0:
+            self.itemsPopulated.emit()
 
     def _handle_yield(self, data: Tuple[PackageMetadataProtocol, bool, Dict]):
         """Output from a worker process.
@@ -1678,24 +1771,32 @@ class BaseQtPluginDialog(QDialog):
         The data is stored but the actual items are added via a timer in the `_add_items`
         method to prevent the UI from freezing by adding all items at once.
         """
-        self._plugin_data.append(data)
-        self._filter_texts = [
-            f"{i[0].name} {i[-1].get('display_name', '')} {i[0].summary}".lower()
-            for i in self._plugin_data
-        ]
-        metadata, _, _ = data
-        self._plugin_data_map[metadata.name] = data
+        self._handle_yield_batch([data])
+
+    def _handle_yield_batch(
+        self, batch: Sequence[Tuple[PackageMetadataProtocol, bool, Dict]]
+    ):
+        """Output from a worker process yielding several plugins at once.
+
+        Same as `_handle_yield` but the plugin count is only updated once
+        for the whole `batch`.
+        """
+        for data in batch:
+            self._plugin_data.append(data)
+            metadata, _, extra_info = data
+            # Keep `_filter_texts` in step with `_plugin_data` one entry at a time
+            self._filter_texts.append(
+                f"{metadata.name} {extra_info.get('display_name', '')} {metadata.summary}".lower()
+            )
+            self._plugin_data_map[metadata.name] = data
         self.available_list.set_data(self._plugin_data)
         self._update_plugin_count()
 
     def _search_in_available(self, text):
-        idxs = []
-        for idx, item in enumerate(self._filter_texts):
-            if text.lower().strip() in item:
-                idxs.append(idx)
-                self._filter_idxs_cache.add(idx)
-
-        return idxs
+        query = text.lower().strip()
+        return [
+            idx for idx, item in enumerate(self._filter_texts) if query in item
+        ]
 
     def _refresh_and_clear_cache(self):
         self.refresh(clear_cache=True)
@@ -1764,6 +1865,7 @@ class BaseQtPluginDialog(QDialog):
             text = self.packages_search.text()
         else:
             self.packages_search.setText(text)
+        self._search_timer.stop()
 
         if len(text.strip()) == 0:
             self.installed_list.filter('')
@@ -1772,10 +1874,10 @@ class BaseQtPluginDialog(QDialog):
             self._add_items_timer.stop()
             self._plugins_found = 0
         else:
-            items = [
+            items = deque(
                 self._plugin_data[idx]
                 for idx in self._search_in_available(text)
-            ]
+            )
             # Go over list and remove any not found
             self.installed_list.filter(text.strip().lower())
             self.available_list.filter(text.strip().lower())
@@ -1794,6 +1896,8 @@ class BaseQtPluginDialog(QDialog):
 
     def refresh(self, clear_cache: bool = False):
         self.refresh_button.setDisabled(True)
+        clear_conda_package_cache()
+        clear_installer_tool_cache()
 
         if self.worker is not None:
             self.worker.quit()
@@ -1802,7 +1906,7 @@ class BaseQtPluginDialog(QDialog):
             self._add_items_timer.stop()
 
         self._filter_texts = []
-        self._plugin_queue = []
+        self._plugin_queue = deque()
         self._plugin_data = []
         self._plugin_data_map = {}
 
@@ -1811,7 +1915,13 @@ class BaseQtPluginDialog(QDialog):
         self.already_installed = set()
         self.available_set = set()
 
-        self._add_installed()
+        # Sort and repaint the installed list once it is rebuilt, not after
+        # every item
+        self.installed_list.begin_bulk_add()
+        try:
+            self._add_installed()
+        finally:
+            self.installed_list.end_bulk_add()
         self._fetch_available_plugins(clear_cache=clear_cache)
 
         self._refresh_timer.start()
@@ -3,11 +3,15 @@ These convenience functions will be useful for searching pypi for packages
 that match the plugin naming convention, and retrieving related metadata.
 """
 
+import contextlib
 import json
+import os
 from collections.abc import Iterator
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
+from pathlib import Path
 from typing import (
+    Any,
     Optional,
     TypedDict,
     cast,
@@ -18,10 +22,14 @@ from urllib.request import Request, urlopen
 from napari.plugins.utils import normalized_name
 from napari.utils.notifications import show_warning
 from npe2 import PackageMetadata
+from platformdirs import user_cache_dir
 from typing_extensions import NotRequired
 
 PyPIname = str
 
+# names of the endpoints whose responses are cached on disk
+_CACHED_ENDPOINTS = ('extended_summary', 'conda')
+
 
 @lru_cache
 def _user_agent() -> str:
@@ -49,6 +57,54 @@ def _user_agent() -> str:
     return ' '.join(f'{k}/{v}' for k, v in parts)
 
 
+def _cache_path(name: str) -> Path:
+    """Return the path of the disk cache file for the `name` endpoint."""
+    return Path(
+        user_cache_dir('napari', appauthor=False),
+        'plugin_manager',
+        f'{name}.json',
+    )
+
+
+def _get_json(url: str, name: str) -> Any:
+    """Return the JSON content at `url`, revalidating a disk cached copy.
+
+    The response is stored on disk along with its ETag, so following
+    requests only download the content again if it changed on the server.
+    The disk copy is also used when the server cannot be reached.
+    """
+    path = _cache_path(name)
+    headers = {'User-Agent': _user_agent()}
+    cached = None
+    with contextlib.suppress(OSError, ValueError, KeyError, TypeError):
+        content = json.loads(path.read_text(encoding='utf-8'))
+        etag, data = content['etag'], content['data']
+        # only revalidate a complete copy, a 304 has to find data to return
+        if isinstance(etag, str) and isinstance(data, (dict, list)):
+            headers['If-None-Match'] = etag
+            cached = data
+
+    try:
+        with urlopen(Request(url, headers=headers)) as resp:
+            data = json.load(resp)
+            etag = resp.headers.get('ETag')
+    except URLError:
+        # 304 Not Modified, or no network connectivity
+        if cached is not None:
+            return cached
+        raise
+
+    if etag:
+        with contextlib.suppress(OSError):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f'.{os.getpid()}.tmp')
+            tmp_path.write_text(
+                json.dumps({'etag': etag, 'data': data}), encoding='utf-8'
+            )
+            os.replace(tmp_path, path)
+    return data
+
+
 class _ShortSummaryDict(TypedDict):
     """Objects returned at https://npe2api.vercel.app/api/extended_summary ."""
 
@@ -70,16 +126,14 @@ class SummaryDict(_ShortSummaryDict):
 def plugin_summaries() -> list[SummaryDict]:
     """Return PackageMetadata object for all known napari plugins."""
     url = 'https://npe2api.vercel.app/api/extended_summary'
-    with urlopen(Request(url, headers={'User-Agent': _user_agent()})) as resp:
-        return json.load(resp)
+    return _get_json(url, 'extended_summary')
 
 
 @lru_cache
 def conda_map() -> dict[PyPIname, Optional[str]]:
     """Return map of PyPI package name to conda_channel/package_name ()."""
     url = 'https://npe2api.vercel.app/api/conda'
-    with urlopen(Request(url, headers={'User-Agent': _user_agent()})) as resp:
-        return json.load(resp)
+    return _get_json(url, 'conda')
 
 
 def iter_napari_plugin_info() -> Iterator[tuple[PackageMetadata, bool, dict]]:
@@ -128,3 +182,14 @@ def cache_clear():
     plugin_summaries.cache_clear()
     conda_map.cache_clear()
     _user_agent.cache_clear()
+
+
+def clear_disk_cache():
+    """Remove the responses cached on disk by `plugin_summaries` and `conda_map`.
+
+    `cache_clear` keeps them, they are revalidated with their ETag and
+    used as a fallback when offline.
+    """
+    for name in _CACHED_ENDPOINTS:
+        with contextlib.suppress(OSError):
+            _cache_path(name).unlink()
@@ -3,7 +3,7 @@ The installation logic for the napari plugin manager.
 
 The main object is `NapariInstallerQueue`, a `InstallerQueue` subclass
 with the notion of a job queue. The queued jobs are represented
-by a `deque` of `*InstallerTool` dataclasses (`NapariPipInstallerTool` and
+by a `dict` of `*InstallerTool` dataclasses (`NapariPipInstallerTool` and
 `NapariCondaInstallerTool`).
 """
 
@@ -25,6 +25,26 @@ from napari_plugin_manager.base_qt_package_installer import (
 )
 
 
+def _conda_napari_pin() -> str:
+    # FIXME
+    # dev or rc versions might not be available in public channels
+    # but only installed locally - if we try to pin those, mamba
+    # will fail to pin it because there's no record of that version
+    # in the remote index, only locally; to work around this bug
+    # we will have to pin to e.g. 0.4.* instead of 0.4.17.* for now
+    version_lower = _napari_version.lower()
+    is_dev = "rc" in version_lower or "dev" in version_lower
+    pin_level = 2 if is_dev else 3
+    version = ".".join([str(x) for x in _napari_version_tuple[:pin_level]])
+    return f"napari={version}"
+
+
+# the napari version is fixed for the session, so are the constraints
+_PIP_CONSTRAINTS = (f"napari=={_napari_version}", "numpy<2")
+_CONDA_CONSTRAINTS = (_conda_napari_pin(), "numpy<2.0a0")
+
+
+@lru_cache
 def _get_python_exe():
     # Note: is_bundled_app() returns False even if using a Briefcase bundle...
     # Workaround: see if sys.executable is set to something something napari on Mac
@@ -48,10 +68,10 @@ class NapariPipInstallerTool(PipInstallerTool):
         """
         Version constraints to limit unwanted changes in installation.
         """
-        return [f"napari=={_napari_version}", "numpy<2"]
+        return _PIP_CONSTRAINTS
 
     @classmethod
-    @lru_cache(maxsize=0)
+    @lru_cache
     def _constraints_file(cls) -> str:
         with NamedTemporaryFile(
             "w", suffix="-napari-constraints.txt", delete=False
@@ -64,18 +84,7 @@ class NapariPipInstallerTool(PipInstallerTool):
 class NapariCondaInstallerTool(CondaInstallerTool):
     @staticmethod
     def constraints() -> Sequence[str]:
-        # FIXME
-        # dev or rc versions might not be available in public channels
-        # but only installed locally - if we try to pin those, mamba
-        # will fail to pin it because there's no record of that version
-        # in the remote index, only locally; to work around this bug
-        # we will have to pin to e.g. 0.4.* instead of 0.4.17.* for now
-        version_lower = _napari_version.lower()
-        is_dev = "rc" in version_lower or "dev" in version_lower
-        pin_level = 2 if is_dev else 3
-        version = ".".join([str(x) for x in _napari_version_tuple[:pin_level]])
-
-        return [f"napari={version}", "numpy<2.0a0"]
+        return _CONDA_CONSTRAINTS
 
 
 class NapariInstallerQueue(InstallerQueue):
@@ -1,4 +1,5 @@
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import napari.plugins
@@ -43,6 +44,49 @@ STYLES_PATH = Path(__file__).parent / 'styles.qss'
 DISMISS_WARN_PYPI_INSTALL_DLG = False
 
 
+@lru_cache
+def _colored_icon(name, color, opacity=1):
+    # Every plugin item uses the same few icons, colorize each one once
+    return QColoredSVGIcon.from_resources(name).colored(
+        color=color, opacity=opacity
+    )
+
+
+@lru_cache
+def _colored_pixmap(name, color, size, opacity=1):
+    # QPixmap is implicitly shared, every item can show the same one
+    return _colored_icon(name, color, opacity).pixmap(size, size)
+
+
+@lru_cache(maxsize=1)
+def _npe1_available():
+    # Listing npe1 plugins walks every installed distribution, do it once
+    # per refresh of the installed plugins instead of per checkbox toggle
+    return tuple(napari.plugins.plugin_manager.iter_available())
+
+
+@lru_cache(maxsize=1)
+def _npe1_names_by_distname():
+    names = {}
+    for npe1_name, _, distname in _npe1_available():
+        if distname:
+            names.setdefault(normalized_name(distname), npe1_name)
+    return names
+
+
+def _iter_napari_plugin_info_batches(batch_size=32):
+    # Send plugins to the dialog in lists, one signal per item floods the
+    # GUI thread event loop with thousands of queued calls
+    batch = []
+    for data in iter_napari_plugin_info():
+        batch.append(data)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
 def _show_message(widget):
     message = trans._(
         'When installing/uninstalling npe2 plugins, '
@@ -77,19 +121,16 @@ class PluginListItem(BasePluginListItem):
         # red. Code example:
         # theme_name = get_settings().appearance.theme
         # napari.utils.theme.get_theme(theme_name, as_dict=False).warning.as_hex()
-        return QColoredSVGIcon.from_resources("warning").colored(
-            color="#E3B617"
-        )
+        return _colored_icon("warning", color="#E3B617")
+
+    def _warning_pixmap(self):
+        return _colored_pixmap("warning", "#E3B617", 15)
 
     def _collapsed_icon(self):
-        return QColoredSVGIcon.from_resources('right_arrow').colored(
-            color='white'
-        )
+        return _colored_icon('right_arrow', color='white')
 
     def _expanded_icon(self):
-        return QColoredSVGIcon.from_resources('down_arrow').colored(
-            color='white'
-        )
+        return _colored_icon('down_arrow', color='white')
 
     def _warning_tooltip(self):
         return QtToolTipLabel(self)
@@ -107,10 +148,8 @@ class PluginListItem(BasePluginListItem):
             if plugin_api_version == 'shim'
             else 'npe2'
         )
-        icon = QColoredSVGIcon.from_resources('logo_silhouette').colored(
-            color='#33F0FF', opacity=opacity
-        )
-        self.set_status(icon.pixmap(20, 20), text)
+        pixmap = _colored_pixmap('logo_silhouette', '#33F0FF', 20, opacity)
+        self.set_status(pixmap, text)
 
     def _on_enabled_checkbox(self, state: int):
         """Called with `state` when checkbox is clicked."""
@@ -121,16 +160,9 @@ class PluginListItem(BasePluginListItem):
             pm2.enable(plugin_name) if state else pm2.disable(plugin_name)
             return
 
-        for (
-            npe1_name,
-            _,
-            distname,
-        ) in napari.plugins.plugin_manager.iter_available():
-            if distname and (normalized_name(distname) == plugin_name):
-                napari.plugins.plugin_manager.set_blocked(
-                    npe1_name, not enabled
-                )
-                return
+        npe1_name = _npe1_names_by_distname().get(plugin_name)
+        if npe1_name is not None:
+            napari.plugins.plugin_manager.set_blocked(npe1_name, not enabled)
 
     def _warn_pypi_install(self):
         return running_as_constructor_app() or is_conda_package(
@@ -221,11 +253,9 @@ class QtPluginDialog(BaseQtPluginDialog):
                 )
 
         napari.plugins.plugin_manager.discover()  # since they might not be loaded yet
-        for (
-            plugin_name,
-            _,
-            distname,
-        ) in napari.plugins.plugin_manager.iter_available():
+        _npe1_available.cache_clear()
+        _npe1_names_by_distname.cache_clear()
+        for plugin_name, _, distname in _npe1_available():
             # not showing these in the plugin dialog
             if plugin_name in (
                 'napari_plugin_engine',
@@ -258,8 +288,8 @@ class QtPluginDialog(BaseQtPluginDialog):
         if clear_cache:
             cache_clear()
 
-        self.worker = create_worker(iter_napari_plugin_info)
-        self.worker.yielded.connect(self._handle_yield)
+        self.worker = create_worker(_iter_napari_plugin_info_batches)
+        self.worker.yielded.connect(self._handle_yield_batch)
         self.worker.started.connect(self.working_indicator.show)
         self.worker.finished.connect(self.working_indicator.hide)
         self.worker.finished.connect(self.finished)
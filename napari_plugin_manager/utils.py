@@ -1,22 +1,34 @@
-import re
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import FrozenSet, Optional
+
+
+@lru_cache
+def _conda_package_names(prefix: str) -> FrozenSet[str]:
+    # Installed conda packages within a conda installation and environment can
+    # be identified as files with the template ``<package-name>-<version>-<build-string>.json``
+    # saved within a ``conda-meta`` folder within the given environment of interest.
+    conda_meta_dir = Path(prefix) / 'conda-meta'
+    return frozenset(
+        p.name.rsplit('-', 2)[0] for p in conda_meta_dir.glob("*-*-*.json")
+    )
 
 
 def is_conda_package(pkg: str, prefix: Optional[str] = None) -> bool:
     """Determines if plugin was installed through conda.
 
+    The contents of each ``conda-meta`` folder are read once, call
+    `clear_conda_package_cache` after installing or removing packages.
+
     Returns
     -------
     bool
         ``True` if a conda package, ``False`` if not.
     """
-    # Installed conda packages within a conda installation and environment can
-    # be identified as files with the template ``<package-name>-<version>-<build-string>.json``
-    # saved within a ``conda-meta`` folder within the given environment of interest.
-    conda_meta_dir = Path(prefix or sys.prefix) / 'conda-meta'
-    return any(
-        re.match(rf"{pkg}-[^-]+-[^-]+.json", p.name)
-        for p in conda_meta_dir.glob(f"{pkg}-*-*.json")
-    )
+    return pkg in _conda_package_names(str(prefix or sys.prefix))
+
+
+def clear_conda_package_cache():
+    """Forget the conda packages found by `is_conda_package`."""
+    _conda_package_names.cache_clear()